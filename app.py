@@ -694,8 +694,7 @@ from slack_workflow_engine.home import (
     build_home_placeholder_view,
     build_home_view,
     build_home_decision_modal,
-    list_pending_approvals,
-    list_recent_requests,
+    list_home_bundles,
     normalise_filters,
 )
 
@@ -760,7 +759,7 @@ from slack_workflow_engine.security import (
 
 
 
-    SLACK_SIGNATURE_HEADER,
+    SLACK_SIGNATURE_ENVIRON_KEY,
 
 
 
@@ -792,7 +791,7 @@ from slack_workflow_engine.security import (
 
 
 
-    SLACK_TIMESTAMP_HEADER,
+    SLACK_TIMESTAMP_ENVIRON_KEY,
 
 
 
@@ -1410,7 +1409,7 @@ from slack_workflow_engine.workflows.state import (
     pending_status,
 )
 
-from slack_workflow_engine.workflows.storage import save_request
+from slack_workflow_engine.workflows.storage import fetch_request_summary, save_request
 
 HOME_DEBOUNCER = HomeDebouncer()
 
@@ -1436,56 +1435,36 @@ def _compute_home_filters(settings: AppSettings, *, query: str | None = None):
 
 
 
+def _paginate(rows, filters):
+    """Trim a ``limit + 1`` probe to the page size and describe the page."""
+
+    has_more = len(rows) > filters.limit
+    if has_more:
+        rows = rows[: filters.limit]
+    pagination = PaginationState(
+        offset=filters.offset,
+        limit=filters.limit,
+        has_previous=filters.offset > 0,
+        has_more=has_more,
+    )
+    return rows, pagination
+
+
 def _prepare_home_view(*, user_id: str | None, request_filters, pending_filters):
     with session_scope() as session:
-        my_requests = list_recent_requests(
+        # Each list is probed for one extra row so has_more needs no COUNT query.
+        my_requests, pending = list_home_bundles(
             session,
             user_id=user_id or "",
-            workflow_types=request_filters.workflow_types,
-            statuses=request_filters.statuses,
-            start_at=request_filters.start_at,
-            end_at=request_filters.end_at,
-            sort_by=request_filters.sort_by,
-            sort_order=request_filters.sort_order,
-            limit=request_filters.limit + 1,
-            offset=request_filters.offset,
-            query=request_filters.query,
-        )
-        pending = list_pending_approvals(
-            session,
             approver_id=user_id or "",
-            workflow_types=pending_filters.workflow_types,
-            statuses=pending_filters.statuses,
-            start_at=pending_filters.start_at,
-            end_at=pending_filters.end_at,
-            sort_by=pending_filters.sort_by,
-            sort_order=pending_filters.sort_order,
-            limit=pending_filters.limit + 1,
-            offset=pending_filters.offset,
-            query=pending_filters.query,
+            recent_filters=request_filters,
+            pending_filters=pending_filters,
+            recent_limit=request_filters.limit + 1,
+            pending_limit=pending_filters.limit + 1,
         )
 
-    my_has_more = len(my_requests) > request_filters.limit
-    if my_has_more:
-        my_requests = my_requests[: request_filters.limit]
-
-    pending_has_more = len(pending) > pending_filters.limit
-    if pending_has_more:
-        pending = pending[: pending_filters.limit]
-
-    my_pagination = PaginationState(
-        offset=request_filters.offset,
-        limit=request_filters.limit,
-        has_previous=request_filters.offset > 0,
-        has_more=my_has_more,
-    )
-
-    pending_pagination = PaginationState(
-        offset=pending_filters.offset,
-        limit=pending_filters.limit,
-        has_previous=pending_filters.offset > 0,
-        has_more=pending_has_more,
-    )
+    my_requests, my_pagination = _paginate(my_requests, request_filters)
+    pending, pending_pagination = _paginate(pending, pending_filters)
 
     view = build_home_view(
         my_requests=my_requests,
@@ -1555,13 +1534,18 @@ def _schedule_home_refresh(*, client, logger, user_ids, trace_id: str | None = N
     if not targets:
         return
 
-    run_async(
-        _refresh_home_tabs,
-        client=client,
-        user_ids=targets,
-        logger=logger,
-        trace_id=trace_id,
-    )
+    # Each publish is an independent Slack round trip; fan them out so the
+    # refresh completes in roughly the time of the slowest call. run_async
+    # shares a four-worker pool, which caps the concurrent publishes and
+    # database sessions however many approvers a request has.
+    for user_id in targets:
+        run_async(
+            _refresh_home_tabs,
+            client=client,
+            user_ids=[user_id],
+            logger=logger,
+            trace_id=trace_id,
+        )
 
 
 
@@ -3099,7 +3083,7 @@ def _open_modal(client, trigger_id: str, view: dict, workflow_type: str, logger,
 
 
 
-def _handle_app_home_opened(event, client, logger):
+def _handle_app_home_opened(event, client, logger, settings: AppSettings | None = None):
 
     trace_id = str(uuid4())
 
@@ -3121,7 +3105,7 @@ def _handle_app_home_opened(event, client, logger):
 
             return
 
-        settings = get_settings()
+        settings = settings or get_settings()
         request_filters, pending_filters = _compute_home_filters(settings)
 
         view, recent_count, pending_count = _prepare_home_view(
@@ -3247,16 +3231,17 @@ def _handle_request_command(ack, command, client, logger):
         unbind_contextvars("trace_id")
 
 def _register_home_handlers(bolt_app: SlackApp) -> None:
+    settings = get_settings()
 
     @bolt_app.action(HOME_SEARCH_ACTION_ID)
     def handle_home_search(ack, body, client, logger):
 
-        _handle_home_search_action(ack=ack, body=body, client=client, logger=logger)
+        _handle_home_search_action(ack=ack, body=body, client=client, logger=logger, settings=settings)
 
     @bolt_app.event("app_home_opened")
     def handle_app_home(event, client, logger):
 
-        _handle_app_home_opened(event=event, client=client, logger=logger)
+        _handle_app_home_opened(event=event, client=client, logger=logger, settings=settings)
 
 
 def _register_slash_handlers(bolt_app: SlackApp) -> None:
@@ -4619,11 +4604,36 @@ def _apply_level_decision(
     )
 
 
+def _reply_already_decided(ack, client, log, *, channel_id: str, user_id: str, status: str) -> None:
+    ack()
+    client.chat_postEphemeral(
+        channel=channel_id,
+        user=user_id,
+        text="This request has already been decided.",
+    )
+    log.info("decision_already_recorded", user_id=user_id, decision=status)
 
 
+def _answer_decided_click(session, ack, client, log, *, context, user_id: str) -> bool:
+    """Answer a click on a decided request from one summary row.
 
+    Only clicks that the full checks would reject with StatusTransitionError
+    are answered here, so guard order and the reply channel are unchanged.
+    Returns True when the click has been answered.
+    """
 
+    summary = fetch_request_summary(session, context.request_id)
+    if (
+        summary is None
+        or summary.channel_id is None
+        or summary.type != context.workflow_type
+        or summary.created_by == user_id
+        or is_pending_status(summary.status)
+    ):
+        return False
 
+    _reply_already_decided(ack, client, log, channel_id=summary.channel_id, user_id=user_id, status=summary.status)
+    return True
 
 
 
@@ -4712,7 +4722,14 @@ def _apply_level_decision(
 
 
 
-def _handle_approve_action(ack, body, client, logger):
+
+
+
+
+
+
+
+def _handle_approve_action(ack, body, client, logger, approver_ids: frozenset[str] | None = None):
     trace_id = str(uuid4())
     bind_contextvars(trace_id=trace_id)
     log = structlog.get_logger().bind(trace_id=trace_id)
@@ -4739,8 +4756,9 @@ def _handle_approve_action(ack, body, client, logger):
             log.warning("missing_user_id")
             return
 
-        settings = get_settings()
-        if not is_user_authorized(user_id, settings.approver_user_ids):
+        if approver_ids is None:
+            approver_ids = get_settings().approver_user_id_set
+        if not is_user_authorized(user_id, approver_ids):
             ack()
             channel_id = body.get("channel", {}).get("id")
             if channel_id:
@@ -4771,6 +4789,11 @@ def _handle_approve_action(ack, body, client, logger):
         result = None
 
         with session_scope() as session:
+            # Repeat clicks on a decided request are common; answer them without
+            # loading the request graph.
+            if _answer_decided_click(session, ack, client, log, context=context, user_id=user_id):
+                return
+
             request = session.get(Request, context.request_id)
             if request is None:
                 ack({"response_type": "ephemeral", "text": "Request could not be found."})
@@ -4826,13 +4849,9 @@ def _handle_approve_action(ack, body, client, logger):
                 log.info("level_not_waiting", user_id=user_id)
                 return
             except StatusTransitionError:
-                ack()
-                client.chat_postEphemeral(
-                    channel=message.channel_id,
-                    user=user_id,
-                    text="This request has already been decided.",
+                _reply_already_decided(
+                    ack, client, log, channel_id=message.channel_id, user_id=user_id, status=request.status
                 )
-                log.info("decision_already_recorded", user_id=user_id, decision=request.status)
                 return
             except OptimisticLockError:
                 ack({"response_type": "ephemeral", "text": "Request was updated concurrently. Please try again."})
@@ -4888,7 +4907,7 @@ def _handle_approve_action(ack, body, client, logger):
         unbind_contextvars("trace_id")
 
 
-def _handle_reject_action(ack, body, client, logger):
+def _handle_reject_action(ack, body, client, logger, approver_ids: frozenset[str] | None = None):
     trace_id = str(uuid4())
     bind_contextvars(trace_id=trace_id)
     log = structlog.get_logger().bind(trace_id=trace_id)
@@ -4915,8 +4934,9 @@ def _handle_reject_action(ack, body, client, logger):
             log.warning("missing_user_id")
             return
 
-        settings = get_settings()
-        if not is_user_authorized(user_id, settings.approver_user_ids):
+        if approver_ids is None:
+            approver_ids = get_settings().approver_user_id_set
+        if not is_user_authorized(user_id, approver_ids):
             ack()
             channel_id = body.get("channel", {}).get("id")
             if channel_id:
@@ -4948,6 +4968,11 @@ def _handle_reject_action(ack, body, client, logger):
         result = None
 
         with session_scope() as session:
+            # Repeat clicks on a decided request are common; answer them without
+            # loading the request graph.
+            if _answer_decided_click(session, ack, client, log, context=context, user_id=user_id):
+                return
+
             request = session.get(Request, context.request_id)
             if request is None:
                 ack({"response_type": "ephemeral", "text": "Request could not be found."})
@@ -5003,13 +5028,9 @@ def _handle_reject_action(ack, body, client, logger):
                 log.info("level_not_waiting", user_id=user_id)
                 return
             except StatusTransitionError:
-                ack()
-                client.chat_postEphemeral(
-                    channel=message.channel_id,
-                    user=user_id,
-                    text="This request has already been decided.",
+                _reply_already_decided(
+                    ack, client, log, channel_id=message.channel_id, user_id=user_id, status=request.status
                 )
-                log.info("decision_already_recorded", user_id=user_id, decision=request.status)
                 return
             except OptimisticLockError:
                 ack({"response_type": "ephemeral", "text": "Request was updated concurrently. Please try again."})
@@ -5129,7 +5150,7 @@ def _handle_home_action(decision: str, ack, body, client, logger):
 
         settings = get_settings()
 
-        if not is_user_authorized(user_id, settings.approver_user_ids):
+        if not is_user_authorized(user_id, settings.approver_user_id_set):
 
             _ack_home_error(ack, block_id, "You are not authorized to take action on this request.")
 
@@ -5264,7 +5285,7 @@ def _handle_home_reject_action(ack, body, client, logger):
     _handle_home_action("REJECTED", ack, body, client, logger)
 
 
-def _handle_home_search_action(ack, body, client, logger):
+def _handle_home_search_action(ack, body, client, logger, settings: AppSettings | None = None):
 
     trace_id = str(uuid4())
 
@@ -5316,7 +5337,7 @@ def _handle_home_search_action(ack, body, client, logger):
 
         ack()
 
-        settings = get_settings()
+        settings = settings or get_settings()
 
         request_filters, pending_filters = _compute_home_filters(settings, query=query or None)
 
@@ -5410,7 +5431,7 @@ def _handle_home_decision_submission(ack, body, client, logger):
 
         settings = get_settings()
 
-        if not is_user_authorized(user_id, settings.approver_user_ids):
+        if not is_user_authorized(user_id, settings.approver_user_id_set):
 
             ack({"response_action": "errors", "errors": {"general": "You are not authorized to take action on this request."}})
 
@@ -5634,6 +5655,7 @@ def _handle_home_decision_submission(ack, body, client, logger):
 
 
 def _register_action_handlers(bolt_app: SlackApp) -> None:
+    approver_ids = get_settings().approver_user_id_set
 
 
 
@@ -5729,7 +5751,7 @@ def _register_action_handlers(bolt_app: SlackApp) -> None:
 
 
 
-        _handle_approve_action(ack=ack, body=body, client=client, logger=logger)
+        _handle_approve_action(ack=ack, body=body, client=client, logger=logger, approver_ids=approver_ids)
 
 
 
@@ -5857,7 +5879,7 @@ def _register_action_handlers(bolt_app: SlackApp) -> None:
 
 
 
-        _handle_reject_action(ack=ack, body=body, client=client, logger=logger)
+        _handle_reject_action(ack=ack, body=body, client=client, logger=logger, approver_ids=approver_ids)
 
 
     @bolt_app.action(HOME_APPROVE_ACTION_ID)
@@ -6990,7 +7012,7 @@ def create_app() -> Flask:
 
 
 
-        raw_body = request.get_data(as_text=True)
+        raw_body = request.get_data()
 
 
 
@@ -7022,7 +7044,7 @@ def create_app() -> Flask:
 
 
 
-        timestamp = request.headers.get(SLACK_TIMESTAMP_HEADER, "")
+        timestamp = request.environ.get(SLACK_TIMESTAMP_ENVIRON_KEY, "")
 
 
 
@@ -7054,7 +7076,7 @@ def create_app() -> Flask:
 
 
 
-        signature = request.headers.get(SLACK_SIGNATURE_HEADER, "")
+        signature = request.environ.get(SLACK_SIGNATURE_ENVIRON_KEY, "")
 
 
 
@@ -7118,7 +7140,7 @@ def create_app() -> Flask:
 
 
 
-            signing_secret=settings.signing_secret,
+            signing_secret=settings.signing_secret_bytes,
 
 
 
@@ -17,7 +17,8 @@ from slack_workflow_engine.models import Base
 def reset_database() -> None:
     engine = get_engine()
     Base.metadata.drop_all(engine)
-    Base.metadata.create_all(engine)
+    # drop_all just removed every table, so skip the per-table existence checks.
+    Base.metadata.create_all(engine, checkfirst=False)
     print("Local database reset.")
 
 
@@ -3,9 +3,19 @@
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
 from typing import Iterable
 
+_SAFE_WORKFLOW_TYPE = re.compile(r"[A-Za-z0-9_-]+")
+# Matches the compact shape produced by ``encode_action_value`` (and the spaced
+# variant json.dumps emits) so the common case skips the JSON decoder. Digits
+# and whitespace are spelled out so nothing json.loads would reject matches.
+_FAST_ACTION_VALUE = re.compile(
+    r'\{"request_id":[ \t\n\r]*(0|[1-9][0-9]*),[ \t\n\r]*"workflow_type":[ \t\n\r]*"([A-Za-z0-9_-]+)"'
+    r'(?:,[ \t\n\r]*"level":[ \t\n\r]*(0|[1-9][0-9]*))?\}'
+)
+
 
 @dataclass(frozen=True)
 class ActionContext:
@@ -16,9 +26,36 @@ class ActionContext:
     level: int | None = None
 
 
+def encode_action_value(request_id: int, workflow_type: str, level: int | None = None) -> str:
+    """Serialise an action value without going through the JSON encoder.
+
+    The payload shape is fixed, so workflow types that need no escaping are
+    interpolated directly; anything else falls back to ``json.dumps``.
+    """
+
+    if not _SAFE_WORKFLOW_TYPE.fullmatch(workflow_type):
+        payload: dict[str, object] = {"request_id": request_id, "workflow_type": workflow_type}
+        if level is not None:
+            payload["level"] = level
+        return json.dumps(payload, separators=(",", ":"))
+
+    if level is None:
+        return f'{{"request_id":{int(request_id)},"workflow_type":"{workflow_type}"}}'
+    return f'{{"request_id":{int(request_id)},"workflow_type":"{workflow_type}","level":{int(level)}}}'
+
+
 def parse_action_context(raw_value: str) -> ActionContext:
     """Parse the action value into a structured context."""
 
+    match = _FAST_ACTION_VALUE.fullmatch(raw_value) if isinstance(raw_value, str) else None
+    if match is not None:
+        level = match.group(3)
+        return ActionContext(
+            request_id=int(match.group(1)),
+            workflow_type=match.group(2),
+            level=int(level) if level is not None else None,
+        )
+
     try:
         payload = json.loads(raw_value)
     except json.JSONDecodeError as exc:
@@ -43,7 +80,12 @@ def parse_action_context(raw_value: str) -> ActionContext:
 
 
 def is_user_authorized(user_id: str, allowed_ids: Iterable[str]) -> bool:
-    """Return True when the user is in the configured allow list."""
+    """Return True when the user is in the configured allow list.
+
+    Sets are assumed to hold already-normalised ids and are checked directly.
+    """
 
+    if isinstance(allowed_ids, (set, frozenset)):
+        return user_id in allowed_ids
     normalized = {item.strip() for item in allowed_ids if item}
     return user_id in normalized
@@ -1,7 +1,10 @@
 """Utilities for running background tasks."""
 
+import asyncio
+import threading
 from contextvars import copy_context
 from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from typing import Any, Callable
 
 from structlog.contextvars import bind_contextvars, get_contextvars
@@ -9,6 +12,17 @@ from structlog.contextvars import bind_contextvars, get_contextvars
 
 _executor = ThreadPoolExecutor(max_workers=4)
 
+_loop = asyncio.new_event_loop()
+# Blocking work still runs on threads; keep the pool at its previous bound
+# rather than asyncio's default of min(32, cpu + 4) workers.
+_loop.set_default_executor(_executor)
+_loop_thread = threading.Thread(
+    target=_loop.run_forever,
+    name="slack-workflow-background",
+    daemon=True,
+)
+_loop_thread.start()
+
 
 def run_async(
     func: Callable[..., Any],
@@ -17,7 +31,7 @@ def run_async(
     trace_id: str | None = None,
     **kwargs: Any,
 ) -> Future:
-    """Submit *func* to the shared thread pool and return a Future."""
+    """Schedule *func* on the shared background event loop and return a Future."""
 
     context = copy_context()
 
@@ -28,7 +42,8 @@ def run_async(
 
             context.run(lambda: bind_contextvars(trace_id=trace_id))
 
-    def runner() -> Any:
-        return context.run(func, *args, **kwargs)
+    async def runner() -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(context.run, func, *args, **kwargs))
 
-    return _executor.submit(runner)
+    return asyncio.run_coroutine_threadsafe(runner(), _loop)
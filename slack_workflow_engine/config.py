@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import os
-from functools import lru_cache
-from typing import Iterable, List
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+from typing import Any, FrozenSet, Iterable, Iterator, List
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
@@ -33,6 +34,25 @@ class AppSettings(BaseModel):
             raise ValueError("Home limits must be greater than zero")
         return value
 
+    @cached_property
+    def approver_user_id_set(self) -> FrozenSet[str]:
+        """Approver ids as a frozenset for constant-time membership checks."""
+
+        return frozenset(self.approver_user_ids)
+
+    @cached_property
+    def signing_secret_bytes(self) -> bytes:
+        """Signing secret encoded once for HMAC verification."""
+
+        return self.signing_secret.encode("utf-8")
+
+
+# Cached properties computed from a field; dropped whenever that field is overridden.
+_DERIVED_SETTINGS = {
+    "approver_user_ids": ("approver_user_id_set",),
+    "signing_secret": ("signing_secret_bytes",),
+}
+
 
 def _format_missing(fields: Iterable[str]) -> str:
     """Return a human-friendly comma-separated list of missing env vars."""
@@ -57,3 +77,27 @@ def get_settings() -> AppSettings:
             f"{_format_missing(missing)}"
         )
         raise RuntimeError(message) from exc
+
+
+@contextmanager
+def override(**values: Any) -> Iterator[AppSettings]:
+    """Temporarily replace attributes on the cached settings instance.
+
+    Intended for tests that need one setting changed without re-reading the
+    environment and re-validating the whole model.
+    """
+
+    settings = get_settings()
+    previous = {name: getattr(settings, name) for name in values}
+
+    def _apply(updates: dict[str, Any]) -> None:
+        for name, value in updates.items():
+            setattr(settings, name, value)
+            for derived in _DERIVED_SETTINGS.get(name, ()):
+                settings.__dict__.pop(derived, None)
+
+    _apply(values)
+    try:
+        yield settings
+    finally:
+        _apply(previous)
@@ -7,8 +7,9 @@ from functools import lru_cache
 from typing import Generator
 
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from slack_workflow_engine import get_settings
 
@@ -20,6 +21,17 @@ def get_engine() -> Engine:
     """Create or return a cached SQLAlchemy engine."""
 
     settings = get_settings()
+    url = make_url(settings.database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # A private in-memory database only lives as long as its connection, so
+        # every session has to share the one connection.
+        return create_engine(
+            url,
+            future=True,
+            echo=False,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
     return create_engine(settings.database_url, future=True, echo=False)
 
 
@@ -1,6 +1,6 @@
 """Home tab utilities for the Slack Workflow Engine."""
 
-from .data import RequestSummary, list_pending_approvals, list_recent_requests
+from .data import RequestSummary, list_home_bundles, list_pending_approvals, list_recent_requests
 from .debounce import HomeDebouncer
 from .filters import (
     HomeFilters,
@@ -43,6 +43,7 @@ __all__ = [
     "build_home_decision_modal",
     "build_home_view",
     "build_home_placeholder_view",
+    "list_home_bundles",
     "list_pending_approvals",
     "list_recent_requests",
 ]
@@ -6,11 +6,16 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Iterable, List, Literal, Sequence
 
-from sqlalchemy import Select, select, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session, aliased
 
 from slack_workflow_engine.models import Request
 
+from .filters import HomeFilters
+
+_RECENT_BUCKET = 0
+_PENDING_BUCKET = 1
+
 
 @dataclass(frozen=True)
 class RequestSummary:
@@ -26,21 +31,21 @@ class RequestSummary:
     decided_at: datetime | None
 
 
+def _to_summary(row: Request) -> RequestSummary:
+    return RequestSummary(
+        id=row.id,
+        workflow_type=row.type,
+        status=row.status,
+        created_by=row.created_by,
+        created_at=row.created_at,
+        payload_json=row.payload_json,
+        decided_by=row.decided_by,
+        decided_at=row.decided_at,
+    )
+
+
 def _to_summaries(session: Session, statement: Select) -> List[RequestSummary]:
-    rows = session.scalars(statement).all()
-    return [
-        RequestSummary(
-            id=row.id,
-            workflow_type=row.type,
-            status=row.status,
-            created_by=row.created_by,
-            created_at=row.created_at,
-            payload_json=row.payload_json,
-            decided_by=row.decided_by,
-            decided_at=row.decided_at,
-        )
-        for row in rows
-    ]
+    return [_to_summary(row) for row in session.scalars(statement)]
 
 
 def _normalise_dt(value: datetime | None) -> datetime | None:
@@ -84,18 +89,19 @@ def _apply_filters(
     return statement
 
 
-def _apply_sort(statement: Select, *, sort_by: str, sort_order: Literal["asc", "desc"] = "desc") -> Select:
+def _sort_clause(*, sort_by: str, sort_order: Literal["asc", "desc"] = "desc"):
     order = sort_order.lower()
     descending = order == "desc"
 
     if sort_by == "status":
-        clause = Request.status.desc() if descending else Request.status.asc()
-    elif sort_by == "type":
-        clause = Request.type.desc() if descending else Request.type.asc()
-    else:
-        clause = Request.created_at.desc() if descending else Request.created_at.asc()
+        return Request.status.desc() if descending else Request.status.asc()
+    if sort_by == "type":
+        return Request.type.desc() if descending else Request.type.asc()
+    return Request.created_at.desc() if descending else Request.created_at.asc()
+
 
-    return statement.order_by(clause)
+def _apply_sort(statement: Select, *, sort_by: str, sort_order: Literal["asc", "desc"] = "desc") -> Select:
+    return statement.order_by(_sort_clause(sort_by=sort_by, sort_order=sort_order))
 
 
 def _apply_query(statement: Select, *, query: str | None) -> Select:
@@ -115,6 +121,25 @@ def _apply_query(statement: Select, *, query: str | None) -> Select:
     return statement.where(or_(*clauses))
 
 
+def _filtered_statement(
+    statement: Select,
+    *,
+    workflow_types: Sequence[str] | Iterable[str] | None,
+    statuses: Sequence[str] | Iterable[str] | None,
+    start_at: datetime | None,
+    end_at: datetime | None,
+    query: str | None,
+) -> Select:
+    statement = _apply_filters(
+        statement,
+        workflow_types=workflow_types,
+        statuses=statuses,
+        start_at=start_at,
+        end_at=end_at,
+    )
+    return _apply_query(statement, query=query)
+
+
 def list_recent_requests(
     session: Session,
     *,
@@ -134,17 +159,15 @@ def list_recent_requests(
     if not user_id:
         return []
 
-    statement = select(Request).where(Request.created_by == user_id)
-    statement = _apply_filters(
-        statement,
+    statement = _filtered_statement(
+        select(Request).where(Request.created_by == user_id),
         workflow_types=workflow_types,
         statuses=statuses,
         start_at=start_at,
         end_at=end_at,
+        query=query,
     )
-
     statement = _apply_sort(statement, sort_by=sort_by, sort_order=sort_order)
-    statement = _apply_query(statement, query=query)
     statement = statement.offset(max(offset, 0)).limit(limit)
 
     return _to_summaries(session, statement)
@@ -169,18 +192,106 @@ def list_pending_approvals(
     if not approver_id:
         return []
 
-    statement = select(Request).where(Request.created_by != approver_id)
-
-    statement = _apply_filters(
-        statement,
+    statement = _filtered_statement(
+        select(Request).where(Request.created_by != approver_id),
         workflow_types=workflow_types,
         statuses=statuses,
         start_at=start_at,
         end_at=end_at,
+        query=query,
     )
-
     statement = _apply_sort(statement, sort_by=sort_by, sort_order=sort_order)
-    statement = _apply_query(statement, query=query)
     statement = statement.offset(max(offset, 0)).limit(limit)
 
     return _to_summaries(session, statement)
+
+
+def _bundle_branch(statement: Select, filters: HomeFilters, *, limit: int, bucket: int):
+    statement = _filtered_statement(
+        statement,
+        workflow_types=filters.workflow_types,
+        statuses=filters.statuses,
+        start_at=filters.start_at,
+        end_at=filters.end_at,
+        query=filters.query,
+    )
+    clause = _sort_clause(sort_by=filters.sort_by, sort_order=filters.sort_order)
+    statement = statement.add_columns(
+        literal(bucket).label("bucket"),
+        func.row_number().over(order_by=clause).label("position"),
+    )
+    statement = statement.order_by(clause).offset(max(filters.offset, 0)).limit(limit)
+    # SQLite rejects LIMIT/ORDER BY on compound members, so wrap each branch.
+    return select(statement.subquery())
+
+
+def list_home_bundles(
+    session: Session,
+    *,
+    user_id: str,
+    approver_id: str,
+    recent_filters: HomeFilters,
+    pending_filters: HomeFilters,
+    recent_limit: int | None = None,
+    pending_limit: int | None = None,
+) -> tuple[List[RequestSummary], List[RequestSummary]]:
+    """Return the recent requests and pending approvals for the Home tab in one query.
+
+    The result matches calling :func:`list_recent_requests` and
+    :func:`list_pending_approvals` with the same filters, but both lists are
+    read with a single ``UNION ALL`` round-trip.
+    """
+
+    recent_limit = recent_filters.limit if recent_limit is None else recent_limit
+    pending_limit = pending_filters.limit if pending_limit is None else pending_limit
+
+    if not user_id or not approver_id:
+        recent = list_recent_requests(
+            session,
+            user_id=user_id,
+            limit=recent_limit,
+            offset=recent_filters.offset,
+            workflow_types=recent_filters.workflow_types,
+            statuses=recent_filters.statuses,
+            start_at=recent_filters.start_at,
+            end_at=recent_filters.end_at,
+            sort_by=recent_filters.sort_by,
+            sort_order=recent_filters.sort_order,
+            query=recent_filters.query,
+        )
+        pending = list_pending_approvals(
+            session,
+            approver_id=approver_id,
+            limit=pending_limit,
+            offset=pending_filters.offset,
+            workflow_types=pending_filters.workflow_types,
+            statuses=pending_filters.statuses,
+            start_at=pending_filters.start_at,
+            end_at=pending_filters.end_at,
+            sort_by=pending_filters.sort_by,
+            sort_order=pending_filters.sort_order,
+            query=pending_filters.query,
+        )
+        return recent, pending
+
+    combined = union_all(
+        _bundle_branch(
+            select(Request).where(Request.created_by == user_id),
+            recent_filters,
+            limit=recent_limit,
+            bucket=_RECENT_BUCKET,
+        ),
+        _bundle_branch(
+            select(Request).where(Request.created_by != approver_id),
+            pending_filters,
+            limit=pending_limit,
+            bucket=_PENDING_BUCKET,
+        ),
+    ).subquery()
+    row = aliased(Request, combined)
+    statement = select(row, combined.c.bucket).order_by(combined.c.bucket, combined.c.position)
+
+    buckets: tuple[List[RequestSummary], List[RequestSummary]] = ([], [])
+    for request, bucket in session.execute(statement):
+        buckets[bucket].append(_to_summary(request))
+    return buckets
@@ -4,26 +4,48 @@ from __future__ import annotations
 
 import threading
 import time
+from array import array
 from datetime import timedelta
-from typing import Callable, Dict
+from typing import Callable
+
+_DEFAULT_SLOTS = 4096
+_EMPTY_KEY = 0
+_NEVER = float("-inf")
 
 
 class HomeDebouncer:
-    """Keep per-user timestamps to prevent redundant Home publishes."""
+    """Keep per-user timestamps to prevent redundant Home publishes.
+
+    Timestamps live in a fixed-size, direct-mapped table indexed by the user
+    id hash, so memory stays bounded however many users open the Home tab.
+    Each slot also records the full hash of its owner: a colliding user evicts
+    the previous entry instead of inheriting its window, which can only cause
+    an extra publish, never a skipped one.
+    """
 
     def __init__(
         self,
         *,
         window: timedelta = timedelta(seconds=5),
         timer: Callable[[], float] | None = None,
+        slots: int = _DEFAULT_SLOTS,
     ) -> None:
         if window.total_seconds() <= 0:
             raise ValueError("Debounce window must be greater than zero seconds.")
+        if slots <= 0 or slots & (slots - 1):
+            raise ValueError("Debounce slots must be a positive power of two.")
 
-        self._window = window
+        self._window_s = window.total_seconds()
         self._timer = timer or time.monotonic
         self._lock = threading.Lock()
-        self._last_published: Dict[str, float] = {}
+        self._mask = slots - 1
+        self._keys = array("q", [_EMPTY_KEY]) * slots
+        self._stamps = array("d", [_NEVER]) * slots
+
+    @staticmethod
+    def _key(user_id: str) -> int:
+        # Reserve zero for empty slots.
+        return hash(user_id) or 1
 
     def should_publish(self, user_id: str) -> bool:
         """Return True when a publish should proceed for *user_id*.
@@ -37,17 +59,17 @@ class HomeDebouncer:
             # If we cannot identify the user, avoid blocking the publish.
             return True
 
+        key = self._key(user_id)
+        index = key & self._mask
         now = self._timer()
-        threshold = self._window.total_seconds()
 
         with self._lock:
-            last = self._last_published.get(user_id)
+            if self._keys[index] == key and now - self._stamps[index] < self._window_s:
+                return False
 
-            if last is None or now - last >= threshold:
-                self._last_published[user_id] = now
-                return True
-
-            return False
+            self._keys[index] = key
+            self._stamps[index] = now
+            return True
 
     def clear(self, user_id: str | None = None) -> None:
         """Clear stored timestamps.
@@ -58,6 +80,13 @@ class HomeDebouncer:
 
         with self._lock:
             if user_id is None:
-                self._last_published.clear()
-            else:
-                self._last_published.pop(user_id, None)
+                slots = len(self._keys)
+                self._keys = array("q", [_EMPTY_KEY]) * slots
+                self._stamps = array("d", [_NEVER]) * slots
+                return
+
+            key = self._key(user_id)
+            index = key & self._mask
+            if self._keys[index] == key:
+                self._keys[index] = _EMPTY_KEY
+                self._stamps[index] = _NEVER
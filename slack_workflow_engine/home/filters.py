@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Iterable, Sequence
 
 
-VALID_SORT_FIELDS = {"created_at", "status", "type"}
-VALID_SORT_ORDERS = {"asc", "desc"}
+VALID_SORT_FIELDS = frozenset({"created_at", "status", "type"})
+VALID_SORT_ORDERS = frozenset({"asc", "desc"})
 
 
 def _clean_sequence(values: Sequence[str] | Iterable[str] | None) -> list[str] | None:
@@ -57,8 +58,8 @@ def _clean_text(value: str | None) -> str | None:
 
 @dataclass(frozen=True)
 class HomeFilters:
-    workflow_types: list[str] | None
-    statuses: list[str] | None
+    workflow_types: Sequence[str] | None
+    statuses: Sequence[str] | None
     start_at: datetime | None
     end_at: datetime | None
     sort_by: str
@@ -77,30 +78,36 @@ class PaginationState:
 
 
 def clamp_limit(value: int | None, *, default: int, minimum: int = 1, maximum: int = 50) -> int:
-    if value is None:
+    if type(value) is int:
+        numeric = value
+    elif value is None:
         return default
+    else:
+        try:
+            numeric = int(value)
+        except (TypeError, ValueError):
+            return default
 
-    try:
-        numeric = int(value)
-    except (TypeError, ValueError):
-        return default
-
-    return max(minimum, min(maximum, numeric))
+    return minimum if numeric < minimum else maximum if numeric > maximum else numeric
 
 
 def clamp_offset(value: int | None) -> int:
-    if value is None:
+    if type(value) is int:
+        numeric = value
+    elif value is None:
         return 0
+    else:
+        try:
+            numeric = int(value)
+        except (TypeError, ValueError):
+            return 0
 
-    try:
-        numeric = int(value)
-    except (TypeError, ValueError):
-        return 0
-
-    return max(0, numeric)
+    return numeric if numeric > 0 else 0
 
 
 def validate_sort_field(value: str | None, *, default: str = "created_at") -> str:
+    if value in VALID_SORT_FIELDS:
+        return value
     candidate = (value or "").strip().lower()
     if candidate in VALID_SORT_FIELDS:
         return candidate
@@ -108,6 +115,8 @@ def validate_sort_field(value: str | None, *, default: str = "created_at") -> st
 
 
 def validate_sort_order(value: str | None, *, default: str = "desc") -> str:
+    if value in VALID_SORT_ORDERS:
+        return value
     candidate = (value or "").strip().lower()
     if candidate in VALID_SORT_ORDERS:
         return candidate
@@ -126,6 +135,72 @@ def normalise_filters(
     offset: int | None = None,
     default_limit: int = 10,
     query: str | None = None,
+) -> HomeFilters:
+    if (
+        workflow_types is None
+        and start_at is None
+        and end_at is None
+        and query is None
+        and (statuses is None or type(statuses) is tuple)
+    ):
+        # The App Home defaults only vary by statuses, sorting and paging, so
+        # the normalised result is shared between events.
+        return _normalise_default_filters(statuses, sort_by, sort_order, limit, offset, default_limit)
+
+    return _build_filters(
+        workflow_types=workflow_types,
+        statuses=statuses,
+        start_at=start_at,
+        end_at=end_at,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        limit=limit,
+        offset=offset,
+        default_limit=default_limit,
+        query=query,
+    )
+
+
+@lru_cache(maxsize=64)
+def _normalise_default_filters(
+    statuses: tuple[str, ...] | None,
+    sort_by: str | None,
+    sort_order: str | None,
+    limit: int | None,
+    offset: int | None,
+    default_limit: int,
+) -> HomeFilters:
+    filters = _build_filters(
+        workflow_types=None,
+        statuses=statuses,
+        start_at=None,
+        end_at=None,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        limit=limit,
+        offset=offset,
+        default_limit=default_limit,
+        query=None,
+    )
+    # The cached instance is handed to every caller, so its statuses must not
+    # be a mutable list.
+    if filters.statuses is not None:
+        filters = replace(filters, statuses=tuple(filters.statuses))
+    return filters
+
+
+def _build_filters(
+    *,
+    workflow_types: Sequence[str] | Iterable[str] | None,
+    statuses: Sequence[str] | Iterable[str] | None,
+    start_at: str | datetime | None,
+    end_at: str | datetime | None,
+    sort_by: str | None,
+    sort_order: str | None,
+    limit: int | None,
+    offset: int | None,
+    default_limit: int,
+    query: str | None,
 ) -> HomeFilters:
     return HomeFilters(
         workflow_types=_clean_sequence(workflow_types),
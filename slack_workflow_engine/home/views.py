@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import UTC
 from typing import Iterable, Sequence
 
@@ -14,6 +13,7 @@ from .actions import (
 )
 from .data import RequestSummary
 from .filters import HomeFilters, PaginationState
+from slack_workflow_engine.actions import encode_action_value
 from slack_workflow_engine.workflows.state import extract_level_from_status, is_pending_status
 
 
@@ -161,11 +161,8 @@ def _pagination_blocks(title: str, prefix: str, pagination: PaginationState) ->
 
 
 def _decision_payload(summary: RequestSummary) -> str:
-    payload: dict[str, object] = {"request_id": summary.id, "workflow_type": summary.workflow_type}
     level = extract_level_from_status(summary.status)
-    if level is not None:
-        payload["level"] = level
-    return json.dumps(payload, separators=(",", ":"))
+    return encode_action_value(summary.id, summary.workflow_type, level)
 
 
 def _pending_action_blocks(pending: Sequence[RequestSummary]) -> list[dict]:
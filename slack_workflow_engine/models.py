@@ -5,8 +5,9 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import List
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, update
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, insert, update
 from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
+from sqlalchemy.orm.attributes import set_committed_value
 
 from slack_workflow_engine.db import Base
 
@@ -153,23 +154,35 @@ def advance_request_status(
             updated_at=datetime.now(UTC),
             version=request.version + 1,
         )
+        .execution_options(synchronize_session=False)
     )
-    result = session.execute(stmt)
-    if result.rowcount != 1:
-        session.rollback()
-        raise OptimisticLockError(f"Request {request.id} was updated concurrently")
-
-    session.refresh(request)
-
-    session.add(
-        StatusHistory(
-            request_id=request.id,
-            from_status=previous_status,
-            to_status=new_status,
-            changed_at=decided_time,
-            changed_by=decided_by,
-        )
+    if session.get_bind().dialect.update_returning:
+        # Columns handed back by RETURNING so the instance can be updated without a reload.
+        changed_columns = (Request.status, Request.decided_by, Request.decided_at, Request.updated_at, Request.version)
+        row = session.execute(stmt.returning(*changed_columns)).one_or_none()
+        if row is None:
+            session.rollback()
+            raise OptimisticLockError(f"Request {request.id} was updated concurrently")
+        for column, value in zip(changed_columns, row):
+            set_committed_value(request, column.key, value)
+    else:
+        result = session.execute(stmt)
+        if result.rowcount != 1:
+            session.rollback()
+            raise OptimisticLockError(f"Request {request.id} was updated concurrently")
+        session.refresh(request)
+
+    session.execute(
+        insert(StatusHistory),
+        {
+            "request_id": request.id,
+            "from_status": previous_status,
+            "to_status": new_status,
+            "changed_at": decided_time,
+            "changed_by": decided_by,
+        },
     )
-    session.flush()
+    # The Core insert bypasses the ORM, so a loaded history collection is stale.
+    session.expire(request, ["status_history"])
 
     return request
@@ -4,26 +4,37 @@ from __future__ import annotations
 
 import hmac
 import time
-from hashlib import sha256
 
 
 SLACK_SIGNATURE_HEADER = "X-Slack-Signature"
 SLACK_TIMESTAMP_HEADER = "X-Slack-Request-Timestamp"
+# WSGI environ keys for the headers above; reading these skips header normalisation.
+SLACK_SIGNATURE_ENVIRON_KEY = "HTTP_X_SLACK_SIGNATURE"
+SLACK_TIMESTAMP_ENVIRON_KEY = "HTTP_X_SLACK_REQUEST_TIMESTAMP"
 VERSION = "v0"
 DEFAULT_TOLERANCE = 60 * 5  # five minutes
 
+_now = time.time
 
-def compute_signature(signing_secret: str, timestamp: str, body: str) -> str:
-    """Return Slack-compatible signature for the provided payload."""
 
-    basestring = f"{VERSION}:{timestamp}:{body}".encode("utf-8")
-    secret = signing_secret.encode("utf-8")
-    digest = hmac.new(secret, basestring, sha256).hexdigest()
+def compute_signature(signing_secret: str | bytes, timestamp: str, body: str | bytes) -> str:
+    """Return Slack-compatible signature for the provided payload.
+
+    ``signing_secret`` may be pre-encoded bytes (see ``AppSettings.signing_secret_bytes``)
+    and ``body`` may be the raw request bytes, so neither is re-encoded per request.
+    """
+
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    basestring = f"{VERSION}:{timestamp}:".encode("utf-8") + body
+    if isinstance(signing_secret, str):
+        signing_secret = signing_secret.encode("utf-8")
+    digest = hmac.digest(signing_secret, basestring, "sha256").hex()
     return f"{VERSION}={digest}"
 
 
 def is_valid_slack_request(
-    *, signing_secret: str, timestamp: str, body: str, signature: str, tolerance: int = DEFAULT_TOLERANCE
+    *, signing_secret: str | bytes, timestamp: str, body: str | bytes, signature: str, tolerance: int = DEFAULT_TOLERANCE
 ) -> bool:
     """Validate Slack signature and timestamp to guard against replay attacks."""
 
@@ -35,7 +46,7 @@ def is_valid_slack_request(
     except (TypeError, ValueError):
         return False
 
-    current_ts = int(time.time())
+    current_ts = int(_now())
     if abs(current_ts - request_ts) > tolerance:
         return False
 
@@ -10,10 +10,18 @@ from typing import Dict
 from .models import WorkflowDefinition
 
 
-@lru_cache()
 def load_workflow_definition(file_path: Path) -> WorkflowDefinition:
-    """Load a workflow definition from a JSON file."""
+    """Load a workflow definition from a JSON file.
 
+    Parsed definitions are cached per path and modification time, so an edited
+    file is picked up without restarting the process.
+    """
+
+    return _load_workflow_definition(file_path, file_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _load_workflow_definition(file_path: Path, mtime_ns: int) -> WorkflowDefinition:
     with file_path.open("r", encoding="utf-8") as fp:
         data = json.load(fp)
     return WorkflowDefinition.model_validate(data)
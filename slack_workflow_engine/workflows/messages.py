@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, Iterable, List
 
+from slack_workflow_engine.actions import encode_action_value
+
 from .models import WorkflowDefinition
 
 APPROVE_ACTION_ID = "workflow_approve"
@@ -43,10 +44,7 @@ def _build_fields_section(definition: WorkflowDefinition, submission: Dict[str,
 
 
 def _decision_buttons_payload(request_id: int, workflow_type: str, approver_level: int | None = None) -> Dict[str, Any]:
-    payload_obj: Dict[str, Any] = {"request_id": request_id, "workflow_type": workflow_type}
-    if approver_level is not None:
-        payload_obj["level"] = approver_level
-    payload = json.dumps(payload_obj, separators=(",", ":"))
+    payload = encode_action_value(request_id, workflow_type, approver_level)
     return {
         "type": "actions",
         "block_id": "workflow_decision_buttons",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from typing import Any, Dict
 
@@ -60,16 +61,18 @@ def parse_submission(state_payload: Dict[str, Any], definition: WorkflowDefiniti
     return submission
 
 
+# json.dumps builds a new encoder whenever options are passed; reuse one instead.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
 def canonical_json(data: Dict[str, Any]) -> str:
     """Return a canonical JSON string with stable ordering and whitespace."""
 
-    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return _CANONICAL_ENCODER.encode(data)
 
 
 def compute_request_key(workflow_type: str, user_id: str, canonical_payload: str) -> str:
     """Compute a deterministic request key for idempotency."""
 
-    import hashlib
-
     base = f"{workflow_type}:{user_id}:{canonical_payload}"
     return hashlib.sha256(base.encode("utf-8")).hexdigest()
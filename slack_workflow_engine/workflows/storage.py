@@ -4,11 +4,16 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import Row, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
 
 from slack_workflow_engine.db import session_scope
 from slack_workflow_engine.models import Message, Request, DuplicateRequestError
 
+# Backends whose INSERT can skip a clashing request_key on its own.
+_ON_CONFLICT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
 
 def save_request(
     *,
@@ -20,25 +25,42 @@ def save_request(
 ) -> Request:
     """Persist a new workflow request and return the saved entity."""
 
+    now = datetime.now(UTC)
+    values = {
+        "type": workflow_type,
+        "created_by": created_by,
+        "payload_json": payload_json,
+        "status": status,
+        "created_at": now,
+        "updated_at": now,
+        "request_key": request_key,
+    }
+
     with session_scope() as session:
-        existing = session.execute(
-            select(Request.id).where(Request.request_key == request_key)
-        ).scalar_one_or_none()
-        if existing is not None:
-            raise DuplicateRequestError("Duplicate request submission.")
-
-        request = Request(
-            type=workflow_type,
-            created_by=created_by,
-            payload_json=payload_json,
-            status=status,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-            request_key=request_key,
-        )
-        session.add(request)
-        session.flush()
-        session.refresh(request)
+        dialect_insert = _ON_CONFLICT_INSERTS.get(session.get_bind().dialect.name)
+        if dialect_insert is None:
+            # Backends without ON CONFLICT generally lack INSERT ... RETURNING
+            # too, so check for the key first and let the ORM flush the row.
+            existing = session.execute(
+                select(Request.id).where(Request.request_key == request_key)
+            ).scalar_one_or_none()
+            if existing is not None:
+                raise DuplicateRequestError("Duplicate request submission.")
+            request = Request(**values)
+            session.add(request)
+            session.flush()
+            session.refresh(request)
+        else:
+            # The unique index on request_key detects duplicates inside the INSERT,
+            # and RETURNING hands back the stored row without a reload query.
+            request = session.scalars(
+                dialect_insert(Request)
+                .on_conflict_do_nothing(index_elements=[Request.request_key])
+                .returning(Request),
+                values,
+            ).one_or_none()
+            if request is None:
+                raise DuplicateRequestError("Duplicate request submission.")
         session.expunge(request)
         return request
 
@@ -52,15 +74,33 @@ def save_message_reference(
 ) -> Message:
     """Persist the Slack message reference for a workflow request."""
 
+    values = {
+        "request_id": request_id,
+        "channel_id": channel_id,
+        "ts": ts,
+        "thread_ts": thread_ts,
+    }
+
     with session_scope() as session:
-        message = Message(
-            request_id=request_id,
-            channel_id=channel_id,
-            ts=ts,
-            thread_ts=thread_ts,
-        )
-        session.add(message)
-        session.flush()
-        session.refresh(message)
+        if session.get_bind().dialect.insert_returning:
+            message = session.scalars(insert(Message).returning(Message), values).one()
+        else:
+            message = Message(**values)
+            session.add(message)
+            session.flush()
+            session.refresh(message)
         session.expunge(message)
         return message
+
+
+def fetch_request_summary(session: Session, request_id: int) -> Row | None:
+    """Return the status, type, owner and message channel for *request_id*.
+
+    The columns come from one Core select, so no entities are loaded.
+    """
+
+    return session.execute(
+        select(Request.status, Request.type, Request.created_by, Message.channel_id)
+        .outerjoin(Message, Message.request_id == Request.id)
+        .where(Request.id == request_id)
+    ).one_or_none()
@@ -0,0 +1,253 @@
+"""Shared pytest fixtures."""
+
+import json
+import logging
+from types import MappingProxyType
+
+import pytest
+import structlog
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app as app_module
+from slack_workflow_engine import db, security
+from slack_workflow_engine.db import Base
+
+SHARED_DATABASE_URL = "sqlite:///file:slack_workflow_engine_tests?mode=memory&cache=shared&uri=true"
+
+TEST_ENVIRONMENT = {
+    "SLACK_BOT_TOKEN": "token",
+    "SLACK_SIGNING_SECRET": "secret",
+    "APPROVER_USER_IDS": "U1,U2",
+    "DATABASE_URL": "sqlite:///:memory:",
+}
+
+
+@event.listens_for(Engine, "connect")
+def _fast_sqlite_pragmas(dbapi_connection, connection_record):
+    """Trade durability for speed on every SQLite connection opened by the tests."""
+
+    if type(dbapi_connection).__module__ != "sqlite3":
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _test_environment():
+    """Seed the required settings once; tests override single values via monkeypatch."""
+
+    with pytest.MonkeyPatch.context() as patcher:
+        for name, value in TEST_ENVIRONMENT.items():
+            patcher.setenv(name, value)
+        yield
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _quiet_structlog():
+    """Drop structured log events instead of timestamping and rendering them.
+
+    ``capture_logs`` swaps its own processors in, so tests that inspect log
+    events still see every one of them.
+    """
+
+    previous = structlog.get_config()
+    structlog.configure(processors=[], logger_factory=structlog.ReturnLoggerFactory())
+    yield
+    structlog.configure(**previous)
+
+
+def run_async_inline(func, /, *args, trace_id=None, **kwargs):
+    """Run background work immediately; the trace id is only used for log context."""
+
+    return func(*args, **kwargs)
+
+
+@pytest.fixture
+def sync_run_async(monkeypatch):
+    """Finish scheduled handler work before the test asserts on it."""
+
+    monkeypatch.setattr(app_module, "run_async", run_async_inline)
+
+
+@pytest.fixture(scope="module")
+def workflows_dir(request, tmp_path_factory):
+    """Write the requesting module's ``REFUND_WORKFLOW`` into a definitions directory."""
+
+    workflows_dir = tmp_path_factory.mktemp("workflows")
+    definition = request.module.REFUND_WORKFLOW
+    (workflows_dir / "refund.json").write_text(json.dumps(definition), encoding="utf-8")
+    return workflows_dir
+
+
+def _schema_script(engine) -> str:
+    """Compile the metadata DDL once into a script SQLite can run in one call."""
+
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(engine)).strip())
+        statements.extend(str(CreateIndex(index).compile(engine)) for index in table.indexes)
+    return ";\n".join(statements) + ";\n"
+
+
+@pytest.fixture(scope="session")
+def shared_engine():
+    """Create the in-memory schema once for every test that opts in."""
+
+    engine = create_engine(
+        SHARED_DATABASE_URL,
+        future=True,
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # pysqlite issues its own BEGIN/COMMIT; hand transaction control to SQLAlchemy
+    # so SAVEPOINTs nest correctly inside the per-test outer transaction.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    raw_connection = engine.raw_connection()
+    try:
+        raw_connection.driver_connection.executescript(_schema_script(engine))
+    finally:
+        raw_connection.close()
+
+    yield engine
+    # Closing the last connection discards the in-memory database, so there is
+    # nothing to drop first.
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session_factory(shared_engine, monkeypatch):
+    """Bind ``session_scope`` to a connection whose transaction is rolled back after the test.
+
+    Sessions keep their loaded state across commits so setup helpers can read
+    generated ids without a reload query.
+    """
+
+    connection = shared_engine.connect()
+    transaction = connection.begin()
+    factory = sessionmaker(
+        bind=connection,
+        autoflush=False,
+        autocommit=False,
+        future=True,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    monkeypatch.setattr(db, "get_session_factory", lambda: factory)
+
+    yield factory
+
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def bolt_logger():
+    """Standard logger passed where Bolt would inject its app logger."""
+
+    return logging.getLogger("slack_workflow_engine.tests")
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Return a setter that pins the clock used for Slack signature checks."""
+
+    def freeze(timestamp: int) -> None:
+        monkeypatch.setattr(security, "_now", lambda: timestamp)
+
+    return freeze
+
+
+class DummyClient:
+    __slots__ = (
+        "open_calls",
+        "post_calls",
+        "update_calls",
+        "ephemeral_calls",
+        "publish_calls",
+        "publish_user_ids",
+    )
+
+    # Handlers only read the acknowledgement, so every call can share one.
+    _OK = MappingProxyType({"ok": True})
+
+    def __init__(self):
+        self.open_calls: list[dict] = []
+        self.post_calls: list[dict] = []
+        self.update_calls: list[dict] = []
+        self.ephemeral_calls: list[dict] = []
+        self.publish_calls: list[dict] = []
+        self.publish_user_ids: set[str] = set()
+
+    def views_open(self, **kwargs):
+        self.open_calls.append(kwargs)
+        return self._OK
+
+    def chat_postMessage(self, **kwargs):
+        self.post_calls.append(kwargs)
+        return {
+            "ok": True,
+            "channel": kwargs["channel"],
+            "ts": "1700000000.000100",
+            "message": {"thread_ts": "1700000000.000100"},
+        }
+
+    def chat_update(self, **kwargs):
+        self.update_calls.append(kwargs)
+        return self._OK
+
+    def chat_postEphemeral(self, **kwargs):
+        self.ephemeral_calls.append(kwargs)
+        return self._OK
+
+    def views_publish(self, **kwargs):
+        self.publish_calls.append(kwargs)
+        self.publish_user_ids.add(kwargs["user_id"])
+        return self._OK
+
+
+class RecordingLogger:
+    __slots__ = ("infos", "warnings", "errors")
+
+    def __init__(self) -> None:
+        self.infos: list[tuple] = []
+        self.warnings: list[tuple] = []
+        self.errors: list[tuple] = []
+
+    def info(self, *args, **kwargs):  # pragma: no cover - logger passed by Slack
+        self.infos.append((args, kwargs))
+
+    def warning(self, *args, **kwargs):  # pragma: no cover
+        self.warnings.append((args, kwargs))
+
+    def error(self, *args, **kwargs):  # pragma: no cover
+        self.errors.append((args, kwargs))
+
+
+@pytest.fixture
+def dummy_client():
+    """Slack WebClient stand-in that records the calls handlers make."""
+
+    return DummyClient()
+
+
+@pytest.fixture
+def recording_logger():
+    """Bolt logger stand-in that records messages by level."""
+
+    return RecordingLogger()
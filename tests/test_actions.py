@@ -1,16 +1,12 @@
 """Tests for Slack action parsing and authorization helpers."""
 
-from pathlib import Path
-import sys
+import json
 
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from slack_workflow_engine.actions import (  # noqa: E402
+from slack_workflow_engine.actions import (
     ActionContext,
+    encode_action_value,
     is_user_authorized,
     parse_action_context,
 )
@@ -21,6 +17,17 @@ def test_parse_action_context_valid_payload():
     assert context == ActionContext(request_id=10, workflow_type="refund")
 
 
+@pytest.mark.parametrize(
+    "payload",
+    [
+        '{"request_id": 4, "workflow_type": "refund", "level": 2}',
+        '{"level": 2, "workflow_type": "refund", "request_id": 4}',
+    ],
+)
+def test_parse_action_context_with_level(payload):
+    assert parse_action_context(payload) == ActionContext(request_id=4, workflow_type="refund", level=2)
+
+
 @pytest.mark.parametrize(
     "payload",
     [
@@ -36,6 +43,21 @@ def test_parse_action_context_invalid(payload):
         parse_action_context(payload)
 
 
+@pytest.mark.parametrize(
+    "payload",
+    [
+        '{"request_id": 1\u0664, "workflow_type": "refund"}',
+        '{"request_id": 4, "workflow_type": "refund", "level": 2\u0662}',
+        '{"request_id":\u00a04, "workflow_type": "refund"}',
+    ],
+    ids=["arabic-indic-id", "arabic-indic-level", "nbsp"],
+)
+def test_parse_action_context_non_ascii_uses_json_path(payload):
+    # The fast path must not accept what json.loads rejects.
+    with pytest.raises(ValueError):
+        parse_action_context(payload)
+
+
 def test_is_user_authorized_true():
     allowed = ["U1", "U2", " U3 "]
     assert is_user_authorized("U3", allowed) is True
@@ -45,3 +67,29 @@ def test_is_user_authorized_false():
     allowed = ["U1", "U2"]
     assert is_user_authorized("U9", allowed) is False
 
+
+def test_is_user_authorized_accepts_frozenset():
+    allowed = frozenset({"U1", "U2"})
+    assert is_user_authorized("U2", allowed) is True
+    assert is_user_authorized("U9", allowed) is False
+
+
+@pytest.mark.parametrize(
+    ("request_id", "workflow_type", "level"),
+    [
+        (7, "refund", None),
+        (8, "travel-expense", 2),
+        (9, 'odd "type"', 1),
+        (10, "refund\n", None),
+    ],
+)
+def test_encode_action_value_round_trips(request_id, workflow_type, level):
+    encoded = encode_action_value(request_id, workflow_type, level)
+
+    expected = {"request_id": request_id, "workflow_type": workflow_type}
+    if level is not None:
+        expected["level"] = level
+    assert json.loads(encoded) == expected
+    assert parse_action_context(encoded) == ActionContext(
+        request_id=request_id, workflow_type=workflow_type, level=level
+    )
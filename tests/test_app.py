@@ -1,28 +1,24 @@
 """Tests for the Flask application factory."""
 
-from pathlib import Path
-import sys
-from types import SimpleNamespace
+import threading
 
 import pytest
 from flask import Response
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:  # pragma: no cover
-    sys.path.insert(0, str(ROOT))
-
-import app as app_module  # noqa: E402
-from slack_workflow_engine import config, security  # noqa: E402
+import app as app_module
+from slack_workflow_engine import config, security
 
 
 class DummyHandler:
     called = False
+    handled = threading.Event()
 
     def __init__(self, bolt_app):
         self.bolt_app = bolt_app
 
     def handle(self, _request):
         DummyHandler.called = True
+        DummyHandler.handled.set()
         return Response("ok", status=200)
 
 
@@ -42,16 +38,24 @@ def _signed_headers(secret: str, body: str, timestamp: str) -> dict[str, str]:
     }
 
 
-def test_slack_events_route_uses_handler(monkeypatch):
-    _seed_env(monkeypatch)
+@pytest.fixture(scope="module")
+def flask_app():
+    """Create the app once; these tests only vary the request they send."""
+
+    with pytest.MonkeyPatch.context() as patcher:
+        _seed_env(patcher)
+        patcher.setattr(app_module, "SlackRequestHandler", DummyHandler)
+        yield app_module.create_app()
+    config.get_settings.cache_clear()
 
+
+def test_slack_events_route_uses_handler(flask_app, frozen_time):
     DummyHandler.called = False
-    monkeypatch.setattr(app_module, "SlackRequestHandler", DummyHandler)
-    flask_app = app_module.create_app()
+    DummyHandler.handled.clear()
 
     body = "{}"
     timestamp = "1700000000"
-    monkeypatch.setattr(security, "time", SimpleNamespace(time=lambda: int(timestamp)))
+    frozen_time(int(timestamp))
     headers = _signed_headers("secret", body, timestamp)
 
     client = flask_app.test_client()
@@ -64,47 +68,26 @@ def test_slack_events_route_uses_handler(monkeypatch):
 
     assert response.status_code == 200
     assert response.data == b""
+    # The handler runs on the background loop after the ack is returned.
+    assert DummyHandler.handled.wait(timeout=1)
     assert DummyHandler.called is True
 
 
-def test_invalid_signature_returns_unauthorised(monkeypatch):
-    _seed_env(monkeypatch)
-
-    DummyHandler.called = False
-    monkeypatch.setattr(app_module, "SlackRequestHandler", DummyHandler)
-    flask_app = app_module.create_app()
-
-    body = "{}"
-    timestamp = "1700000000"
-    monkeypatch.setattr(security, "time", SimpleNamespace(time=lambda: int(timestamp)))
-
-    client = flask_app.test_client()
-    response = client.post(
-        "/slack/events",
-        data=body,
-        content_type="application/json",
-        headers={
-            security.SLACK_SIGNATURE_HEADER: "v0=invalid",
-            security.SLACK_TIMESTAMP_HEADER: timestamp,
-        },
-    )
-
-    assert response.status_code == 401
-    assert response.get_json()["error"] == "invalid_signature"
-    assert DummyHandler.called is False
-
-
-def test_stale_timestamp_rejected(monkeypatch):
-    _seed_env(monkeypatch)
-
+@pytest.mark.parametrize(
+    ("request_timestamp", "now", "signature"),
+    [
+        pytest.param("1700000000", 1700000000, "v0=invalid", id="invalid-signature"),
+        pytest.param("100", 2000, None, id="stale-timestamp"),
+    ],
+)
+def test_unverified_requests_return_unauthorised(flask_app, frozen_time, request_timestamp, now, signature):
     DummyHandler.called = False
-    monkeypatch.setattr(app_module, "SlackRequestHandler", DummyHandler)
-    flask_app = app_module.create_app()
 
     body = "{}"
-    request_timestamp = "100"
-    monkeypatch.setattr(security, "time", SimpleNamespace(time=lambda: 2000))
+    frozen_time(now)
     headers = _signed_headers("secret", body, request_timestamp)
+    if signature is not None:
+        headers[security.SLACK_SIGNATURE_HEADER] = signature
 
     client = flask_app.test_client()
     response = client.post(
@@ -119,7 +102,7 @@ def test_stale_timestamp_rejected(monkeypatch):
     assert DummyHandler.called is False
 
 
-def test_slack_events_ack_is_immediate(monkeypatch):
+def test_slack_events_ack_is_immediate(monkeypatch, frozen_time):
     _seed_env(monkeypatch)
 
     def slow_handle(_request):
@@ -134,7 +117,7 @@ def test_slack_events_ack_is_immediate(monkeypatch):
 
     body = "{}"
     timestamp = "1700000000"
-    monkeypatch.setattr(security, "time", SimpleNamespace(time=lambda: int(timestamp)))
+    frozen_time(int(timestamp))
     headers = _signed_headers("secret", body, timestamp)
 
     client = flask_app.test_client()
@@ -1,102 +1,44 @@
 """Tests for the approve action handler."""
 
-import json
-from pathlib import Path
-import sys
-
 import pytest
+from sqlalchemy import func, select
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-import app as app_module  # noqa: E402
-from slack_workflow_engine import config  # noqa: E402
-from slack_workflow_engine.db import Base, get_engine, get_session_factory  # noqa: E402
-from slack_workflow_engine.models import ApprovalDecision, Request  # noqa: E402
-from slack_workflow_engine.workflows.requests import canonical_json  # noqa: E402
+import app as app_module
+from slack_workflow_engine import config
+from slack_workflow_engine.actions import encode_action_value
+from slack_workflow_engine.models import ApprovalDecision, Request
+from slack_workflow_engine.workflows.requests import canonical_json
 from slack_workflow_engine.workflows.storage import (
     save_message_reference,
     save_request,
-)  # noqa: E402
-
-
-@pytest.fixture(autouse=True)
-def configure_environment(monkeypatch, tmp_path):
-    db_path = tmp_path / "actions.db"
-    workflows_dir = tmp_path / "workflows"
-    workflows_dir.mkdir()
-    workflow = {
-        "type": "refund",
-        "title": "Refund Request",
-        "fields": [
-            {"name": "order_id", "label": "Order ID", "type": "text", "required": True},
+)
+
+
+REFUND_WORKFLOW = {
+    "type": "refund",
+    "title": "Refund Request",
+    "fields": [
+        {"name": "order_id", "label": "Order ID", "type": "text", "required": True},
+    ],
+    "approvers": {
+        "strategy": "sequential",
+        "levels": [
+            {"members": ["U123"], "quorum": 1},
         ],
-        "approvers": {
-            "strategy": "sequential",
-            "levels": [
-                {"members": ["U123"], "quorum": 1},
-            ],
-        },
-        "notify_channel": "CREFUND",
-    }
-    (workflows_dir / "refund.json").write_text(json.dumps(workflow), encoding="utf-8")
-
-    monkeypatch.setenv("SLACK_BOT_TOKEN", "token")
-    monkeypatch.setenv("SLACK_SIGNING_SECRET", "secret")
-    monkeypatch.setenv("APPROVER_USER_IDS", "U123,U456")
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
+    },
+    "notify_channel": "CREFUND",
+}
 
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
 
-    engine = get_engine()
-    Base.metadata.create_all(engine)
+@pytest.fixture(autouse=True)
+def configure_environment(monkeypatch, workflows_dir, db_session_factory, sync_run_async):
     monkeypatch.setattr(app_module, "WORKFLOW_DEFINITION_DIR", workflows_dir)
     from slack_workflow_engine.workflows import commands as workflow_commands
-    from slack_workflow_engine.workflows import loader as workflow_loader
 
     monkeypatch.setattr(workflow_commands, "WORKFLOW_DEFINITION_DIR", workflows_dir)
-    workflow_loader.load_workflow_definition.cache_clear()
-
-    yield
-
-    Base.metadata.drop_all(engine)
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
-
-
-@pytest.fixture
-def logger():
-    bolt_app = app_module._create_bolt_app(config.get_settings())
-    return bolt_app.logger
-
 
-class DummySlackWebClient:
-    def __init__(self):
-        self.update_calls = []
-        self.ephemeral_calls = []
-        self.publish_calls = []
-
-    def chat_update(self, **kwargs):
-        self.update_calls.append(kwargs)
-        return {"ok": True}
-
-    def chat_postEphemeral(self, **kwargs):
-        self.ephemeral_calls.append(kwargs)
-        return {"ok": True}
-
-    def views_publish(self, **kwargs):
-        self.publish_calls.append(kwargs)
-        return {"ok": True}
-
-def _run_async_sync(func, /, *args, **kwargs):
-    """Execute run_async workloads synchronously while ignoring trace context metadata."""
-
-    kwargs.pop("trace_id", None)
-    return func(*args, **kwargs)
+    with config.override(approver_user_ids=["U123", "U456"]):
+        yield
 
 
 def _create_request_with_message():
@@ -116,66 +58,60 @@ def _create_request_with_message():
     return request
 
 
-def test_handle_approve_action_authorized(monkeypatch, logger):
+def test_handle_approve_action_authorized(bolt_logger, db_session_factory, dummy_client):
     request = _create_request_with_message()
     ack_payloads = []
 
     def ack(payload=None):
         ack_payloads.append(payload)
 
-    slack_client = DummySlackWebClient()
-
-    monkeypatch.setattr(app_module, "run_async", _run_async_sync)
+    slack_client = dummy_client
 
     body = {
         "user": {"id": "U123"},
         "channel": {"id": "CREFUND"},
         "actions": [
             {
-                "value": json.dumps({"request_id": request.id, "workflow_type": "refund"}),
+                "value": encode_action_value(request.id, "refund"),
             }
         ],
     }
 
-    app_module._handle_approve_action(ack=ack, body=body, client=slack_client, logger=logger)
+    app_module._handle_approve_action(ack=ack, body=body, client=slack_client, logger=bolt_logger)
 
     assert ack_payloads == [{"response_type": "ephemeral", "text": "Request approved."}]
     assert slack_client.update_calls
-    publish_targets = {call["user_id"] for call in slack_client.publish_calls}
-    assert publish_targets == {"U123", "U222"}
+    assert slack_client.publish_user_ids == {"U123", "U222"}
 
-    factory = get_session_factory()
-    with factory() as session:
+    with db_session_factory() as session:
         refreshed = session.get(Request, request.id)
         assert refreshed.status == "APPROVED"
         assert refreshed.decided_by == "U123"
-        approval = session.query(ApprovalDecision).filter_by(request_id=request.id).one()
+        approval = session.scalars(select(ApprovalDecision).filter_by(request_id=request.id)).one()
         assert approval.decision == "APPROVED"
         assert approval.reason is None
         assert approval.source == "channel"
 
 
-def test_handle_approve_action_unauthorized(monkeypatch, logger):
+def test_handle_approve_action_unauthorized(bolt_logger, db_session_factory, dummy_client):
     request = _create_request_with_message()
     ack_payloads = []
 
     def ack(payload=None):
         ack_payloads.append(payload)
 
-    slack_client = DummySlackWebClient()
-    monkeypatch.setattr(app_module, "run_async", _run_async_sync)
-
+    slack_client = dummy_client
     body = {
         "user": {"id": "U999"},
         "channel": {"id": "CREFUND"},
         "actions": [
             {
-                "value": json.dumps({"request_id": request.id, "workflow_type": "refund"}),
+                "value": encode_action_value(request.id, "refund"),
             }
         ],
     }
 
-    app_module._handle_approve_action(ack=ack, body=body, client=slack_client, logger=logger)
+    app_module._handle_approve_action(ack=ack, body=body, client=slack_client, logger=bolt_logger)
 
     assert ack_payloads == [None]
     assert not slack_client.update_calls
@@ -184,17 +120,13 @@ def test_handle_approve_action_unauthorized(monkeypatch, logger):
         {"channel": "CREFUND", "user": "U999", "text": "You are not authorized to approve this request."}
     ]
 
-    factory = get_session_factory()
-    with factory() as session:
+    with db_session_factory() as session:
         refreshed = session.get(Request, request.id)
         assert refreshed.status == "PENDING_L1"
-        assert session.query(ApprovalDecision).count() == 0
+        assert session.scalar(select(func.count()).select_from(ApprovalDecision)) == 0
 
 
-def test_handle_approve_action_self_guard(monkeypatch, logger):
-    monkeypatch.setenv("APPROVER_USER_IDS", "U123,U456,U333")
-    config.get_settings.cache_clear()
-
+def test_handle_approve_action_self_guard(bolt_logger, db_session_factory, dummy_client):
     submission = {"order_id": "SELF-1"}
     request = save_request(
         workflow_type="refund",
@@ -213,20 +145,19 @@ def test_handle_approve_action_self_guard(monkeypatch, logger):
     def ack(payload=None):
         ack_payloads.append(payload)
 
-    slack_client = DummySlackWebClient()
-    monkeypatch.setattr(app_module, "run_async", _run_async_sync)
-
+    slack_client = dummy_client
     body = {
         "user": {"id": "U333"},
         "channel": {"id": "CSELF"},
         "actions": [
             {
-                "value": json.dumps({"request_id": request.id, "workflow_type": "refund"}),
+                "value": encode_action_value(request.id, "refund"),
             }
         ],
     }
 
-    app_module._handle_approve_action(ack=ack, body=body, client=slack_client, logger=logger)
+    with config.override(approver_user_ids=["U123", "U456", "U333"]):
+        app_module._handle_approve_action(ack=ack, body=body, client=slack_client, logger=bolt_logger)
 
     assert ack_payloads == [None]
     assert not slack_client.update_calls
@@ -235,14 +166,13 @@ def test_handle_approve_action_self_guard(monkeypatch, logger):
         {"channel": "CSELF", "user": "U333", "text": "You cannot approve your own request."}
     ]
 
-    factory = get_session_factory()
-    with factory() as session:
+    with db_session_factory() as session:
         refreshed = session.get(Request, request.id)
         assert refreshed.status == "PENDING"
-        assert session.query(ApprovalDecision).count() == 0
+        assert session.scalar(select(func.count()).select_from(ApprovalDecision)) == 0
 
 
-def test_handle_approve_action_duplicate_click(monkeypatch, logger):
+def test_handle_approve_action_duplicate_click(bolt_logger, db_session_factory, dummy_client):
     request = _create_request_with_message()
 
     ack_payloads = []
@@ -250,21 +180,19 @@ def test_handle_approve_action_duplicate_click(monkeypatch, logger):
     def ack(payload=None):
         ack_payloads.append(payload)
 
-    slack_client = DummySlackWebClient()
-    monkeypatch.setattr(app_module, "run_async", _run_async_sync)
-
+    slack_client = dummy_client
     body = {
         "user": {"id": "U123"},
         "channel": {"id": "CREFUND"},
         "actions": [
             {
-                "value": json.dumps({"request_id": request.id, "workflow_type": "refund"}),
+                "value": encode_action_value(request.id, "refund"),
             }
         ],
     }
 
-    app_module._handle_approve_action(ack=ack, body=body, client=slack_client, logger=logger)
-    app_module._handle_approve_action(ack=ack, body=body, client=slack_client, logger=logger)
+    app_module._handle_approve_action(ack=ack, body=body, client=slack_client, logger=bolt_logger)
+    app_module._handle_approve_action(ack=ack, body=body, client=slack_client, logger=bolt_logger)
 
     assert ack_payloads[0] == {"response_type": "ephemeral", "text": "Request approved."}
     assert ack_payloads[1] is None
@@ -275,10 +203,58 @@ def test_handle_approve_action_duplicate_click(monkeypatch, logger):
         "user": "U123",
         "text": "This request has already been decided.",
     }
-    publish_targets = {call["user_id"] for call in slack_client.publish_calls}
-    assert publish_targets == {"U123", "U222"}
+    assert slack_client.publish_user_ids == {"U123", "U222"}
 
-    factory = get_session_factory()
-    with factory() as session:
-        approvals = session.query(ApprovalDecision).filter_by(request_id=request.id).all()
+    with db_session_factory() as session:
+        approvals = session.scalars(select(ApprovalDecision).filter_by(request_id=request.id)).all()
         assert len(approvals) == 1
+
+
+def test_handle_approve_action_decided_reply_uses_message_channel(bolt_logger, db_session_factory, dummy_client):
+    request = _create_request_with_message()
+    body = {
+        "user": {"id": "U123"},
+        "actions": [
+            {
+                "value": encode_action_value(request.id, "refund"),
+            }
+        ],
+    }
+
+    app_module._handle_approve_action(ack=lambda payload=None: None, body=body, client=dummy_client, logger=bolt_logger)
+
+    ack_payloads = []
+
+    def ack(payload=None):
+        ack_payloads.append(payload)
+
+    # The action body carries no channel; the reply goes to the request message's channel.
+    app_module._handle_approve_action(ack=ack, body=body, client=dummy_client, logger=bolt_logger)
+
+    assert ack_payloads == [None]
+    assert dummy_client.ephemeral_calls == [
+        {
+            "channel": "CREFUND",
+            "user": "U123",
+            "text": "This request has already been decided.",
+        }
+    ]
+
+
+def test_handle_approve_action_self_guard_precedes_decided_reply(bolt_logger, db_session_factory, dummy_client):
+    request = _create_request_with_message()
+    approver_body = {
+        "user": {"id": "U123"},
+        "actions": [{"value": encode_action_value(request.id, "refund")}],
+    }
+    app_module._handle_approve_action(
+        ack=lambda payload=None: None, body=approver_body, client=dummy_client, logger=bolt_logger
+    )
+
+    owner_body = {**approver_body, "user": {"id": "U222"}, "channel": {"id": "CREFUND"}}
+    with config.override(approver_user_ids=["U123", "U222"]):
+        app_module._handle_approve_action(
+            ack=lambda payload=None: None, body=owner_body, client=dummy_client, logger=bolt_logger
+        )
+
+    assert dummy_client.ephemeral_calls[-1]["text"] == "You cannot approve your own request."
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+import time
+
 import structlog
 from structlog.contextvars import bind_contextvars, clear_contextvars, get_contextvars
 from structlog.testing import capture_logs
@@ -53,3 +56,29 @@ def test_run_async_preserves_trace_id_in_background_logs():
     assert event.get("trace_id") == "trace-789"
 
     clear_contextvars()
+
+
+def test_run_async_uses_bounded_executor():
+    """Blocking work should share a pool of at most four threads."""
+
+    lock = threading.Lock()
+    release = threading.Event()
+    running = 0
+    peak = 0
+
+    def work():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        release.wait(timeout=2)
+        with lock:
+            running -= 1
+
+    futures = [run_async(work) for _ in range(8)]
+    time.sleep(0.2)
+    release.set()
+    for future in futures:
+        future.result(timeout=2)
+
+    assert peak == 4
@@ -1,16 +1,10 @@
 """Tests for slash command parsing and workflow loading."""
 
 import json
-from pathlib import Path
-import sys
 
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from slack_workflow_engine.workflows.commands import (  # noqa: E402
+from slack_workflow_engine.workflows.commands import (
     load_workflow_or_raise,
     parse_slash_command,
 )
@@ -1,15 +1,16 @@
 """Tests for configuration helpers."""
 
-from pathlib import Path
-import sys
-
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:  # pragma: no cover
-    sys.path.insert(0, str(ROOT))
+from slack_workflow_engine import config
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings_cache():
+    """Drop settings built from this module's environment once each test ends."""
 
-from slack_workflow_engine import config  # noqa: E402
+    yield
+    config.get_settings.cache_clear()
 
 
 def _seed_env(monkeypatch):
@@ -28,6 +29,7 @@ def test_get_settings_parses_expected_fields(monkeypatch):
     assert settings.bot_token == "token"
     assert settings.signing_secret == "secret"
     assert settings.approver_user_ids == ["U1", "U2", "U3"]
+    assert settings.approver_user_id_set == frozenset({"U1", "U2", "U3"})
     assert settings.database_url == "sqlite:///local.db"
     assert settings.home_recent_limit == 10
     assert settings.home_pending_limit == 10
@@ -64,3 +66,16 @@ def test_missing_environment_variables_raise_runtime_error(monkeypatch):
     assert "SLACK_SIGNING_SECRET" in message
     assert "APPROVER_USER_IDS" in message
     assert "DATABASE_URL" in message
+
+
+def test_override_restores_settings_and_derived_values(monkeypatch):
+    _seed_env(monkeypatch)
+    settings = config.get_settings()
+    assert settings.approver_user_id_set == frozenset({"U1", "U2", "U3"})
+
+    with config.override(approver_user_ids=["UX"]) as overridden:
+        assert overridden is settings
+        assert config.get_settings().approver_user_id_set == frozenset({"UX"})
+
+    assert settings.approver_user_ids == ["U1", "U2", "U3"]
+    assert settings.approver_user_id_set == frozenset({"U1", "U2", "U3"})
@@ -1,33 +1,26 @@
 """Tests for database schema creation."""
 
 from datetime import UTC, datetime
-from pathlib import Path
-import sys
 from types import SimpleNamespace
 
 import pytest
 from sqlalchemy import inspect
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
 from slack_workflow_engine import Base, config
 from slack_workflow_engine.db import get_engine, get_session_factory
 from slack_workflow_engine.models import ApprovalDecision, Message, Request, StatusHistory
 
 
 @pytest.fixture(autouse=True)
-def override_database(monkeypatch, tmp_path):
-    test_db = tmp_path / "test.db"
-    monkeypatch.setenv("SLACK_BOT_TOKEN", "test-token")
-    monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
-    monkeypatch.setenv("APPROVER_USER_IDS", "U1,U2")
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{test_db}")
+def override_database():
     config.get_settings.cache_clear()
     get_engine.cache_clear()
     get_session_factory.cache_clear()
     yield
+    # These tests build and drop their own schema, so their engine is isolated
+    # from conftest's shared one and is the only engine disposed per test.
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
     config.get_settings.cache_clear()
     get_engine.cache_clear()
     get_session_factory.cache_clear()
@@ -35,7 +28,7 @@ def override_database(monkeypatch, tmp_path):
 
 def test_create_all_creates_expected_tables():
     engine = get_engine()
-    Base.metadata.create_all(engine)
+    Base.metadata.create_all(engine, checkfirst=False)
 
     inspector = inspect(engine)
     tables = inspector.get_table_names()
@@ -96,4 +89,12 @@ def test_create_all_creates_expected_tables():
         rows = connection.execute(Request.__table__.select()).fetchall()
         assert len(rows) == 1
 
-    Base.metadata.drop_all(engine)
+
+def test_in_memory_engine_shares_one_connection():
+    engine = get_engine()
+    Base.metadata.create_all(engine, checkfirst=False)
+
+    factory = get_session_factory()
+    with factory() as first, factory() as second:
+        assert first.connection().connection.dbapi_connection is second.connection().connection.dbapi_connection
+        assert "requests" in inspect(first.connection()).get_table_names()
@@ -1,133 +1,92 @@
 import json
-from pathlib import Path
-import sys
 
 import pytest
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:  # pragma: no cover
-    sys.path.insert(0, str(ROOT))
-
-import app as app_module  # noqa: E402
-from slack_workflow_engine import config  # noqa: E402
-from slack_workflow_engine.home import HOME_ATTACHMENT_BLOCK_ID, HOME_REASON_BLOCK_ID  # noqa: E402
-from slack_workflow_engine.db import Base, get_engine, get_session_factory, session_scope  # noqa: E402
-from slack_workflow_engine.models import ApprovalDecision, Message, Request  # noqa: E402
-
-
-class DummyClient:
-    def __init__(self):
-        self.open_calls: list[dict] = []
-        self.update_calls: list[dict] = []
-        self.publish_calls: list[dict] = []
-
-    def views_open(self, **kwargs):
-        self.open_calls.append(kwargs)
-        return {"ok": True}
-
-    def chat_update(self, **kwargs):
-        self.update_calls.append(kwargs)
-        return {"ok": True}
-
-    def views_publish(self, **kwargs):
-        self.publish_calls.append(kwargs)
-        return {"ok": True}
-
-
-class RecordingLogger:
-    def __init__(self) -> None:
-        self.infos: list[tuple] = []
-        self.warnings: list[tuple] = []
-        self.errors: list[tuple] = []
-
-    def info(self, *args, **kwargs):  # pragma: no cover - logger passed by Slack
-        self.infos.append((args, kwargs))
-
-    def warning(self, *args, **kwargs):  # pragma: no cover
-        self.warnings.append((args, kwargs))
-
-    def error(self, *args, **kwargs):  # pragma: no cover
-        self.errors.append((args, kwargs))
-
-
-@pytest.fixture(autouse=True)
-def home_actions_env(monkeypatch, tmp_path):
-    db_path = tmp_path / "home-actions.db"
-    workflows_dir = tmp_path / "workflows"
-    workflows_dir.mkdir()
-    workflow = {
-        "type": "refund",
-        "title": "Refund Request",
-        "fields": [
-            {"name": "amount", "label": "Amount", "type": "number", "required": True},
+from sqlalchemy import func, insert, select
+
+import app as app_module
+from slack_workflow_engine import config
+from slack_workflow_engine.actions import encode_action_value
+from slack_workflow_engine.home import HOME_ATTACHMENT_BLOCK_ID, HOME_REASON_BLOCK_ID
+from slack_workflow_engine.db import session_scope
+from slack_workflow_engine.models import ApprovalDecision, Message, Request
+
+
+REFUND_WORKFLOW = {
+    "type": "refund",
+    "title": "Refund Request",
+    "fields": [
+        {"name": "amount", "label": "Amount", "type": "number", "required": True},
+    ],
+    "approvers": {
+        "strategy": "sequential",
+        "levels": [
+            {"members": ["UAPP"], "quorum": 1},
         ],
-        "approvers": {
-            "strategy": "sequential",
-            "levels": [
-                {"members": ["UAPP"], "quorum": 1},
-            ],
-        },
-        "notify_channel": "CHOME",
-    }
-    (workflows_dir / "refund.json").write_text(json.dumps(workflow), encoding="utf-8")
-    monkeypatch.setenv("SLACK_BOT_TOKEN", "token")
-    monkeypatch.setenv("SLACK_SIGNING_SECRET", "secret")
-    monkeypatch.setenv("APPROVER_USER_IDS", "UAPP")
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
-
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
+    },
+    "notify_channel": "CHOME",
+}
 
-    engine = get_engine()
-    Base.metadata.create_all(engine)
 
+@pytest.fixture(autouse=True)
+def home_actions_env(monkeypatch, workflows_dir, db_session_factory, sync_run_async):
     monkeypatch.setattr(app_module, "WORKFLOW_DEFINITION_DIR", workflows_dir)
     from slack_workflow_engine.workflows import commands as workflow_commands
-    from slack_workflow_engine.workflows import loader as workflow_loader
 
     monkeypatch.setattr(workflow_commands, "WORKFLOW_DEFINITION_DIR", workflows_dir)
-    workflow_loader.load_workflow_definition.cache_clear()
-
-    yield
 
-    Base.metadata.drop_all(engine)
-    engine.dispose()
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
+    with config.override(approver_user_ids=["UAPP"]):
+        yield
 
 
 def _create_request(session, *, created_by="UCREATOR", status="PENDING_L1"):
-    request = Request(
-        type="refund",
-        created_by=created_by,
-        payload_json=json.dumps({"amount": 100}),
-        status=status,
-        request_key=f"key-{created_by}-{status}",
-    )
-    session.add(request)
-    session.commit()
-    request_id = request.id
-    workflow_type = request.type
+    workflow_type = "refund"
+    request_id = session.execute(
+        insert(Request).returning(Request.id),
+        {
+            "type": workflow_type,
+            "created_by": created_by,
+            "payload_json": json.dumps({"amount": 100}),
+            "status": status,
+            "request_key": f"key-{created_by}-{status}",
+        },
+    ).scalar_one()
     return request_id, workflow_type
 
 
 def _create_request_with_message(session, *, created_by="UCREATOR", status="PENDING_L1"):
     request_id, workflow_type = _create_request(session, created_by=created_by, status=status)
-    message = Message(request_id=request_id, channel_id="CHOME", ts="1700000000.100")
-    session.add(message)
-    session.commit()
-    return request_id, workflow_type, message.channel_id, message.ts
+    channel_id, ts = "CHOME", "1700000000.100"
+    session.execute(insert(Message), {"request_id": request_id, "channel_id": channel_id, "ts": ts})
+    return request_id, workflow_type, channel_id, ts
+
+
+_DECISION_METADATA_TEMPLATE = (
+    '{{"request_id":{request_id},"workflow_type":"{workflow_type}","decision":"{decision}","level":{level}}}'
+)
+
+
+def _fetch_request_with_decision(session, request_id):
+    """Load a request, its first approval and the approval count in one query."""
+
+    row = session.execute(
+        select(Request, ApprovalDecision, func.count(ApprovalDecision.id).over())
+        .outerjoin(ApprovalDecision, ApprovalDecision.request_id == Request.id)
+        .where(Request.id == request_id)
+        .order_by(ApprovalDecision.id)
+    ).first()
+    return row[0], row[1], row[2]
+
+
+_BASE_ACTION_BODY = {"trigger_id": "TRIGGER-123"}
 
 
 def _build_body(request_id, workflow_type, *, user_id):
     return {
+        **_BASE_ACTION_BODY,
         "user": {"id": user_id},
-        "trigger_id": "TRIGGER-123",
         "actions": [
             {
-                "value": json.dumps({"request_id": request_id, "workflow_type": workflow_type, "level": 1}),
+                "value": encode_action_value(request_id, workflow_type, 1),
                 "block_id": f"home_pending_actions_{request_id}",
             }
         ],
@@ -152,20 +111,18 @@ def _build_submission_body(
     return {
         "user": {"id": user_id},
         "view": {
-            "private_metadata": json.dumps(
-                {
-                    "request_id": request_id,
-                    "workflow_type": workflow_type,
-                    "decision": decision,
-                    "level": level,
-                }
+            "private_metadata": _DECISION_METADATA_TEMPLATE.format(
+                request_id=request_id,
+                workflow_type=workflow_type,
+                decision=decision,
+                level=level,
             ),
             "state": {"values": values},
         },
     }
 
 
-def test_home_approve_allows_authorized_user(monkeypatch):
+def test_home_approve_allows_authorized_user(db_session_factory, dummy_client, recording_logger):
     with session_scope() as session:
         request_id, workflow_type = _create_request(session, created_by="UCREATOR")
 
@@ -174,8 +131,8 @@ def test_home_approve_allows_authorized_user(monkeypatch):
     def ack(payload=None):
         ack_payloads.append(payload)
 
-    logger = RecordingLogger()
-    client = DummyClient()
+    logger = recording_logger
+    client = dummy_client
 
     app_module._handle_home_approve_action(
         ack=ack,
@@ -193,10 +150,7 @@ def test_home_approve_allows_authorized_user(monkeypatch):
     assert client.publish_calls == []
 
 
-def test_home_approve_blocks_unauthorized_user(monkeypatch):
-    monkeypatch.setenv("APPROVER_USER_IDS", "UX")
-    config.get_settings.cache_clear()
-
+def test_home_approve_blocks_unauthorized_user(db_session_factory, dummy_client, recording_logger):
     with session_scope() as session:
         request_id, workflow_type = _create_request(session, created_by="UCREATOR")
 
@@ -205,14 +159,15 @@ def test_home_approve_blocks_unauthorized_user(monkeypatch):
     def ack(payload=None):
         ack_payloads.append(payload)
 
-    client = DummyClient()
+    client = dummy_client
 
-    app_module._handle_home_approve_action(
-        ack=ack,
-        body=_build_body(request_id, workflow_type, user_id="UAPP"),
-        client=client,
-        logger=RecordingLogger(),
-    )
+    with config.override(approver_user_ids=["UX"]):
+        app_module._handle_home_approve_action(
+            ack=ack,
+            body=_build_body(request_id, workflow_type, user_id="UAPP"),
+            client=client,
+            logger=recording_logger,
+        )
 
     assert ack_payloads
     assert not client.open_calls
@@ -221,7 +176,7 @@ def test_home_approve_blocks_unauthorized_user(monkeypatch):
     assert client.publish_calls == []
 
 
-def test_home_approve_blocks_decided_request(monkeypatch):
+def test_home_approve_blocks_decided_request(db_session_factory, dummy_client, recording_logger):
     with session_scope() as session:
         request_id, workflow_type = _create_request(session, created_by="UCREATOR", status="APPROVED")
 
@@ -230,13 +185,13 @@ def test_home_approve_blocks_decided_request(monkeypatch):
     def ack(payload=None):
         ack_payloads.append(payload)
 
-    client = DummyClient()
+    client = dummy_client
 
     app_module._handle_home_approve_action(
         ack=ack,
         body=_build_body(request_id, workflow_type, user_id="UAPP"),
         client=client,
-        logger=RecordingLogger(),
+        logger=recording_logger,
     )
 
     assert ack_payloads
@@ -246,14 +201,7 @@ def test_home_approve_blocks_decided_request(monkeypatch):
     assert client.publish_calls == []
 
 
-def _sync_run_async(func, /, *args, **kwargs):
-    """Execute run_async workloads synchronously in tests."""
-
-    kwargs.pop("trace_id", None)
-    return func(*args, **kwargs)
-
-
-def test_home_decision_submission_approves_request_and_records(monkeypatch):
+def test_home_decision_submission_approves_request_and_records(db_session_factory, dummy_client, recording_logger):
     with session_scope() as session:
         request_id, workflow_type, _, _ = _create_request_with_message(session, created_by="UCREATOR")
 
@@ -262,9 +210,7 @@ def test_home_decision_submission_approves_request_and_records(monkeypatch):
     def ack(payload=None):
         ack_payloads.append(payload)
 
-    client = DummyClient()
-    monkeypatch.setattr(app_module, "run_async", _sync_run_async)
-
+    client = dummy_client
     body = _build_submission_body(
         request_id,
         workflow_type,
@@ -278,27 +224,25 @@ def test_home_decision_submission_approves_request_and_records(monkeypatch):
         ack=ack,
         body=body,
         client=client,
-        logger=RecordingLogger(),
+        logger=recording_logger,
     )
 
     assert ack_payloads == [{"response_action": "clear"}]
     assert client.update_calls
-    publish_targets = {call["user_id"] for call in client.publish_calls}
-    assert publish_targets == {"UAPP", "UCREATOR"}
+    assert client.publish_user_ids == {"UAPP", "UCREATOR"}
 
-    factory = get_session_factory()
-    with factory() as session:
-        request = session.get(Request, request_id)
+    with db_session_factory() as session:
+        request, approval, approval_count = _fetch_request_with_decision(session, request_id)
         assert request.status == "APPROVED"
         assert request.decided_by == "UAPP"
-        approval = session.query(ApprovalDecision).filter_by(request_id=request_id).one()
+        assert approval_count == 1
         assert approval.decision == "APPROVED"
         assert approval.reason == "Looks good"
         assert approval.attachment_url == "https://example.com/proof.pdf"
         assert approval.source == "home"
 
 
-def test_home_decision_submission_requires_reason_for_reject(monkeypatch):
+def test_home_decision_submission_requires_reason_for_reject(db_session_factory, dummy_client, recording_logger):
     with session_scope() as session:
         request_id, workflow_type, _, _ = _create_request_with_message(session, created_by="UCREATOR")
 
@@ -307,9 +251,7 @@ def test_home_decision_submission_requires_reason_for_reject(monkeypatch):
     def ack(payload=None):
         ack_payloads.append(payload)
 
-    client = DummyClient()
-    monkeypatch.setattr(app_module, "run_async", _sync_run_async)
-
+    client = dummy_client
     body = _build_submission_body(
         request_id,
         workflow_type,
@@ -321,7 +263,7 @@ def test_home_decision_submission_requires_reason_for_reject(monkeypatch):
         ack=ack,
         body=body,
         client=client,
-        logger=RecordingLogger(),
+        logger=recording_logger,
     )
 
     assert ack_payloads
@@ -329,14 +271,14 @@ def test_home_decision_submission_requires_reason_for_reject(monkeypatch):
     assert HOME_REASON_BLOCK_ID in errors
     assert client.publish_calls == []
 
-    factory = get_session_factory()
-    with factory() as session:
-        request = session.get(Request, request_id)
+    with db_session_factory() as session:
+        request, approval, approval_count = _fetch_request_with_decision(session, request_id)
         assert request.status == "PENDING_L1"
-        assert session.query(ApprovalDecision).count() == 0
+        assert approval is None
+        assert approval_count == 0
 
 
-def test_home_decision_submission_validates_attachment_url(monkeypatch):
+def test_home_decision_submission_validates_attachment_url(db_session_factory, dummy_client, recording_logger):
     with session_scope() as session:
         request_id, workflow_type, _, _ = _create_request_with_message(session, created_by="UCREATOR")
 
@@ -345,9 +287,7 @@ def test_home_decision_submission_validates_attachment_url(monkeypatch):
     def ack(payload=None):
         ack_payloads.append(payload)
 
-    client = DummyClient()
-    monkeypatch.setattr(app_module, "run_async", _sync_run_async)
-
+    client = dummy_client
     body = _build_submission_body(
         request_id,
         workflow_type,
@@ -360,7 +300,7 @@ def test_home_decision_submission_validates_attachment_url(monkeypatch):
         ack=ack,
         body=body,
         client=client,
-        logger=RecordingLogger(),
+        logger=recording_logger,
     )
 
     assert ack_payloads
@@ -368,17 +308,14 @@ def test_home_decision_submission_validates_attachment_url(monkeypatch):
     assert HOME_ATTACHMENT_BLOCK_ID in errors
     assert client.publish_calls == []
 
-    factory = get_session_factory()
-    with factory() as session:
-        request = session.get(Request, request_id)
+    with db_session_factory() as session:
+        request, approval, approval_count = _fetch_request_with_decision(session, request_id)
         assert request.status == "PENDING_L1"
-        assert session.query(ApprovalDecision).count() == 0
-
+        assert approval is None
+        assert approval_count == 0
 
-def test_home_decision_submission_blocks_unauthorized_user(monkeypatch):
-    monkeypatch.setenv("APPROVER_USER_IDS", "UX")
-    config.get_settings.cache_clear()
 
+def test_home_decision_submission_blocks_unauthorized_user(db_session_factory, dummy_client, recording_logger):
     with session_scope() as session:
         request_id, workflow_type, _, _ = _create_request_with_message(session, created_by="UCREATOR")
 
@@ -387,9 +324,7 @@ def test_home_decision_submission_blocks_unauthorized_user(monkeypatch):
     def ack(payload=None):
         ack_payloads.append(payload)
 
-    client = DummyClient()
-    monkeypatch.setattr(app_module, "run_async", _sync_run_async)
-
+    client = dummy_client
     body = _build_submission_body(
         request_id,
         workflow_type,
@@ -397,20 +332,21 @@ def test_home_decision_submission_blocks_unauthorized_user(monkeypatch):
         user_id="UAPP",
     )
 
-    app_module._handle_home_decision_submission(
-        ack=ack,
-        body=body,
-        client=client,
-        logger=RecordingLogger(),
-    )
+    with config.override(approver_user_ids=["UX"]):
+        app_module._handle_home_decision_submission(
+            ack=ack,
+            body=body,
+            client=client,
+            logger=recording_logger,
+        )
 
     assert ack_payloads
     errors = ack_payloads[0]["errors"]
     assert "authorized" in " ".join(errors.values()).lower()
     assert client.publish_calls == []
 
-    factory = get_session_factory()
-    with factory() as session:
-        request = session.get(Request, request_id)
+    with db_session_factory() as session:
+        request, approval, approval_count = _fetch_request_with_decision(session, request_id)
         assert request.status == "PENDING_L1"
-        assert session.query(ApprovalDecision).count() == 0
+        assert approval is None
+        assert approval_count == 0
@@ -2,83 +2,50 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
-import sys
 
-import pytest
+from sqlalchemy import insert
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:  # pragma: no cover
-    sys.path.insert(0, str(ROOT))
-
-from slack_workflow_engine import Base, config  # noqa: E402
-from slack_workflow_engine.db import get_engine, get_session_factory  # noqa: E402
-from slack_workflow_engine.home.data import (  # noqa: E402
+from slack_workflow_engine.home.data import (
+    list_home_bundles,
     list_pending_approvals,
     list_recent_requests,
 )
-from slack_workflow_engine.models import Request  # noqa: E402
-
-
-@pytest.fixture(autouse=True)
-def database(monkeypatch, tmp_path):
-    db_path = tmp_path / "home.db"
-    monkeypatch.setenv("SLACK_BOT_TOKEN", "token")
-    monkeypatch.setenv("SLACK_SIGNING_SECRET", "secret")
-    monkeypatch.setenv("APPROVER_USER_IDS", "U1,U2")
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
-
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
-
-    engine = get_engine()
-    Base.metadata.create_all(engine)
-
-    yield
+from slack_workflow_engine.home.filters import normalise_filters
+from slack_workflow_engine.models import Request
 
-    Base.metadata.drop_all(engine)
-    engine.dispose()
 
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
-
-
-def _add_request(
-    session,
+def _request_row(
     *,
     seq: int,
     workflow_type: str,
     created_by: str,
     created_at: datetime,
     status: str = "PENDING",
-) -> None:
-    session.add(
-        Request(
-            type=workflow_type,
-            created_by=created_by,
-            payload_json=json.dumps({"seq": seq}),
-            status=status,
-            created_at=created_at,
-            updated_at=created_at,
-            request_key=f"req-{seq}",
-        )
-    )
-
-
-def test_list_recent_requests_returns_newest_first():
+) -> dict:
+    return {
+        "type": workflow_type,
+        "created_by": created_by,
+        "payload_json": json.dumps({"seq": seq}),
+        "status": status,
+        "created_at": created_at,
+        "updated_at": created_at,
+        "request_key": f"req-{seq}",
+    }
+
+
+def test_list_recent_requests_returns_newest_first(db_session_factory):
     base = datetime(2024, 1, 1, tzinfo=UTC)
-    factory = get_session_factory()
-
-    with factory() as session:
-        _add_request(session, seq=1, workflow_type="refund", created_by="U123", created_at=base - timedelta(minutes=2))
-        _add_request(session, seq=2, workflow_type="refund", created_by="U999", created_at=base - timedelta(minutes=1))
-        _add_request(session, seq=3, workflow_type="expense", created_by="U123", created_at=base)
-        _add_request(session, seq=4, workflow_type="pto", created_by="U123", created_at=base + timedelta(minutes=1))
+    rows = [
+        _request_row(seq=1, workflow_type="refund", created_by="U123", created_at=base - timedelta(minutes=2)),
+        _request_row(seq=2, workflow_type="refund", created_by="U999", created_at=base - timedelta(minutes=1)),
+        _request_row(seq=3, workflow_type="expense", created_by="U123", created_at=base),
+        _request_row(seq=4, workflow_type="pto", created_by="U123", created_at=base + timedelta(minutes=1)),
+    ]
+    with db_session_factory() as session:
+        session.execute(insert(Request), rows)
         session.commit()
 
-    with factory() as session:
+    with db_session_factory() as session:
         results = list_recent_requests(session, user_id="U123", limit=2)
 
     assert [summary.workflow_type for summary in results] == ["pto", "expense"]
@@ -86,45 +53,42 @@ def test_list_recent_requests_returns_newest_first():
     assert results[0].created_at > results[1].created_at
 
 
-def test_list_recent_requests_empty_when_user_missing():
-    factory = get_session_factory()
-    with factory() as session:
+def test_list_recent_requests_empty_when_user_missing(db_session_factory):
+    with db_session_factory() as session:
         result = list_recent_requests(session, user_id="", limit=5)
     assert result == []
 
 
-def test_list_pending_approvals_filters_by_status_and_type():
+def test_list_pending_approvals_filters_by_status_and_type(db_session_factory):
     base = datetime(2024, 1, 1, tzinfo=UTC)
-    factory = get_session_factory()
-
-    with factory() as session:
-        _add_request(session, seq=1, workflow_type="refund", created_by="U123", created_at=base)
-        _add_request(session, seq=2, workflow_type="refund", created_by="U456", created_at=base + timedelta(minutes=1))
-        _add_request(
-            session,
+    rows = [
+        _request_row(seq=1, workflow_type="refund", created_by="U123", created_at=base),
+        _request_row(seq=2, workflow_type="refund", created_by="U456", created_at=base + timedelta(minutes=1)),
+        _request_row(
             seq=3,
             workflow_type="expense",
             created_by="U789",
             created_at=base + timedelta(minutes=2),
-        )
-        _add_request(
-            session,
+        ),
+        _request_row(
             seq=4,
             workflow_type="refund",
             created_by="U789",
             created_at=base + timedelta(minutes=3),
             status="APPROVED",
-        )
-        _add_request(
-            session,
+        ),
+        _request_row(
             seq=5,
             workflow_type="refund",
             created_by="U1",
             created_at=base + timedelta(minutes=4),
-        )
+        ),
+    ]
+    with db_session_factory() as session:
+        session.execute(insert(Request), rows)
         session.commit()
 
-    with factory() as session:
+    with db_session_factory() as session:
         results = list_pending_approvals(
             session,
             approver_id="U1",
@@ -139,26 +103,26 @@ def test_list_pending_approvals_filters_by_status_and_type():
     assert all(summary.created_by != "U1" for summary in results)
 
 
-def test_list_pending_approvals_empty_for_unknown_user():
-    factory = get_session_factory()
-    with factory() as session:
+def test_list_pending_approvals_empty_for_unknown_user(db_session_factory):
+    with db_session_factory() as session:
         result = list_pending_approvals(session, approver_id="", limit=5)
     assert result == []
 
 
-def test_list_recent_requests_supports_filters_sort_and_offset():
+def test_list_recent_requests_supports_filters_sort_and_offset(db_session_factory):
     base = datetime(2024, 5, 1, tzinfo=UTC)
-    factory = get_session_factory()
-
-    with factory() as session:
-        _add_request(session, seq=1, workflow_type="refund", created_by="U999", created_at=base - timedelta(days=2))
-        _add_request(session, seq=2, workflow_type="refund", created_by="U123", created_at=base - timedelta(days=2), status="APPROVED")
-        _add_request(session, seq=3, workflow_type="expense", created_by="U123", created_at=base - timedelta(days=1))
-        _add_request(session, seq=4, workflow_type="expense", created_by="U123", created_at=base)
-        _add_request(session, seq=5, workflow_type="expense", created_by="U123", created_at=base + timedelta(days=1))
+    rows = [
+        _request_row(seq=1, workflow_type="refund", created_by="U999", created_at=base - timedelta(days=2)),
+        _request_row(seq=2, workflow_type="refund", created_by="U123", created_at=base - timedelta(days=2), status="APPROVED"),
+        _request_row(seq=3, workflow_type="expense", created_by="U123", created_at=base - timedelta(days=1)),
+        _request_row(seq=4, workflow_type="expense", created_by="U123", created_at=base),
+        _request_row(seq=5, workflow_type="expense", created_by="U123", created_at=base + timedelta(days=1)),
+    ]
+    with db_session_factory() as session:
+        session.execute(insert(Request), rows)
         session.commit()
 
-    with factory() as session:
+    with db_session_factory() as session:
         results = list_recent_requests(
             session,
             user_id="U123",
@@ -178,18 +142,19 @@ def test_list_recent_requests_supports_filters_sort_and_offset():
     assert results[0].status == "PENDING"
 
 
-def test_list_pending_approvals_supports_sort_and_offset():
+def test_list_pending_approvals_supports_sort_and_offset(db_session_factory):
     base = datetime(2024, 6, 1, tzinfo=UTC)
-    factory = get_session_factory()
-
-    with factory() as session:
-        _add_request(session, seq=1, workflow_type="refund", created_by="U100", created_at=base, status="PENDING")
-        _add_request(session, seq=2, workflow_type="expense", created_by="U101", created_at=base + timedelta(hours=1), status="PENDING")
-        _add_request(session, seq=3, workflow_type="refund", created_by="U102", created_at=base + timedelta(hours=2), status="APPROVED")
-        _add_request(session, seq=4, workflow_type="pto", created_by="U103", created_at=base + timedelta(hours=3), status="PENDING")
+    rows = [
+        _request_row(seq=1, workflow_type="refund", created_by="U100", created_at=base, status="PENDING"),
+        _request_row(seq=2, workflow_type="expense", created_by="U101", created_at=base + timedelta(hours=1), status="PENDING"),
+        _request_row(seq=3, workflow_type="refund", created_by="U102", created_at=base + timedelta(hours=2), status="APPROVED"),
+        _request_row(seq=4, workflow_type="pto", created_by="U103", created_at=base + timedelta(hours=3), status="PENDING"),
+    ]
+    with db_session_factory() as session:
+        session.execute(insert(Request), rows)
         session.commit()
 
-    with factory() as session:
+    with db_session_factory() as session:
         results = list_pending_approvals(
             session,
             approver_id="U200",
@@ -204,37 +169,90 @@ def test_list_pending_approvals_supports_sort_and_offset():
     assert [summary.workflow_type for summary in results] == ["pto", "expense"]
 
 
-def test_list_recent_requests_filters_by_query():
+def test_list_recent_requests_filters_by_query(db_session_factory):
     base = datetime(2024, 7, 1, tzinfo=UTC)
-    factory = get_session_factory()
-
-    with factory() as session:
-        _add_request(session, seq=1, workflow_type="refund", created_by="U123", created_at=base - timedelta(minutes=3))
-        _add_request(session, seq=2, workflow_type="expense", created_by="U123", created_at=base - timedelta(minutes=2))
-        _add_request(session, seq=3, workflow_type="expense", created_by="U999", created_at=base - timedelta(minutes=1))
+    rows = [
+        _request_row(seq=1, workflow_type="refund", created_by="U123", created_at=base - timedelta(minutes=3)),
+        _request_row(seq=2, workflow_type="expense", created_by="U123", created_at=base - timedelta(minutes=2)),
+        _request_row(seq=3, workflow_type="expense", created_by="U999", created_at=base - timedelta(minutes=1)),
+    ]
+    with db_session_factory() as session:
+        session.execute(insert(Request), rows)
         session.commit()
 
-    with factory() as session:
+    with db_session_factory() as session:
         results = list_recent_requests(session, user_id="U123", query="expense")
 
     assert [summary.workflow_type for summary in results] == ["expense"]
     assert all(summary.created_by == "U123" for summary in results)
 
 
-def test_list_pending_approvals_filters_by_query():
+def test_list_pending_approvals_filters_by_query(db_session_factory):
     base = datetime(2024, 8, 1, tzinfo=UTC)
-    factory = get_session_factory()
-
-    with factory() as session:
-        _add_request(session, seq=1, workflow_type="refund", created_by="U600", created_at=base)
-        _add_request(session, seq=2, workflow_type="expense", created_by="U777", created_at=base + timedelta(minutes=1))
-        _add_request(session, seq=3, workflow_type="expense", created_by="U777", created_at=base + timedelta(minutes=2), status="APPROVED")
+    rows = [
+        _request_row(seq=1, workflow_type="refund", created_by="U600", created_at=base),
+        _request_row(seq=2, workflow_type="expense", created_by="U777", created_at=base + timedelta(minutes=1)),
+        _request_row(seq=3, workflow_type="expense", created_by="U777", created_at=base + timedelta(minutes=2), status="APPROVED"),
+    ]
+    with db_session_factory() as session:
+        session.execute(insert(Request), rows)
         session.commit()
 
-    with factory() as session:
+    with db_session_factory() as session:
         results = list_pending_approvals(session, approver_id="UAPP", query="U777")
 
     assert len(results) == 1
     summary = results[0]
     assert summary.workflow_type == "expense"
     assert summary.created_by == "U777"
+
+
+def test_list_home_bundles_matches_separate_queries(db_session_factory):
+    base = datetime(2024, 7, 1, tzinfo=UTC)
+    rows = [
+        _request_row(seq=1, workflow_type="refund", created_by="U123", created_at=base),
+        _request_row(seq=2, workflow_type="expense", created_by="U123", created_at=base + timedelta(hours=1)),
+        _request_row(seq=3, workflow_type="pto", created_by="U123", created_at=base + timedelta(hours=2), status="APPROVED"),
+        _request_row(seq=4, workflow_type="refund", created_by="U200", created_at=base + timedelta(hours=3)),
+        _request_row(seq=5, workflow_type="pto", created_by="U201", created_at=base + timedelta(hours=4)),
+        _request_row(seq=6, workflow_type="expense", created_by="U202", created_at=base + timedelta(hours=5), status="REJECTED"),
+    ]
+    with db_session_factory() as session:
+        session.execute(insert(Request), rows)
+        session.commit()
+
+    recent_filters = normalise_filters(sort_by="type", sort_order="asc", limit=2)
+    pending_filters = normalise_filters(statuses=("PENDING",), sort_by="created_at", sort_order="desc", offset=1, limit=5)
+
+    with db_session_factory() as session:
+        recent, pending = list_home_bundles(
+            session,
+            user_id="U123",
+            approver_id="U123",
+            recent_filters=recent_filters,
+            pending_filters=pending_filters,
+        )
+        expected_recent = list_recent_requests(session, user_id="U123", sort_by="type", sort_order="asc", limit=2)
+        expected_pending = list_pending_approvals(
+            session,
+            approver_id="U123",
+            statuses=["PENDING"],
+            sort_by="created_at",
+            sort_order="desc",
+            offset=1,
+            limit=5,
+        )
+
+    assert [summary.workflow_type for summary in recent] == ["expense", "pto"]
+    assert recent == expected_recent
+    assert [summary.created_by for summary in pending] == ["U200"]
+    assert pending == expected_pending
+
+
+def test_list_home_bundles_empty_when_user_missing(db_session_factory):
+    filters = normalise_filters()
+
+    with db_session_factory() as session:
+        result = list_home_bundles(session, user_id="", approver_id="", recent_filters=filters, pending_filters=filters)
+
+    assert result == ([], [])
@@ -6,6 +6,8 @@ from slack_workflow_engine.home.debounce import HomeDebouncer
 
 
 class FakeTimer:
+    __slots__ = ("_current",)
+
     def __init__(self, start: float = 0.0) -> None:
         self._current = start
 
@@ -66,3 +68,17 @@ def test_clear_allows_reset_of_all_users() -> None:
 def test_invalid_window_raises_value_error() -> None:
     with pytest.raises(ValueError):
         HomeDebouncer(window=timedelta(seconds=0))
+
+
+def test_colliding_users_never_inherit_each_others_window() -> None:
+    timer = FakeTimer()
+    debouncer = HomeDebouncer(window=timedelta(seconds=5), timer=timer, slots=1)
+
+    assert debouncer.should_publish("U123") is True
+    assert debouncer.should_publish("U456") is True
+    assert debouncer.should_publish("U456") is False
+
+
+def test_invalid_slot_count_raises_value_error() -> None:
+    with pytest.raises(ValueError):
+        HomeDebouncer(slots=3)
@@ -1,12 +1,8 @@
 from datetime import UTC, datetime
-from pathlib import Path
-import sys
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:  # pragma: no cover
-    sys.path.insert(0, str(ROOT))
+import pytest
 
-from slack_workflow_engine.home.filters import (  # noqa: E402
+from slack_workflow_engine.home.filters import (
     HomeFilters,
     clamp_limit,
     clamp_offset,
@@ -21,12 +17,14 @@ def test_clamp_limit_enforces_bounds():
     assert clamp_limit("5", default=10) == 5
     assert clamp_limit(-1, default=10) == 1
     assert clamp_limit(200, default=10, maximum=50) == 50
+    assert clamp_limit("abc", default=10) == 10
 
 
 def test_clamp_offset_non_negative():
     assert clamp_offset(None) == 0
     assert clamp_offset("3") == 3
     assert clamp_offset(-5) == 0
+    assert clamp_offset("abc") == 0
 
 
 def test_validate_sort_helpers_use_defaults():
@@ -79,3 +77,21 @@ def test_normalise_filters_defaults_when_invalid():
     assert filters.limit == 7
     assert filters.offset == 0
     assert filters.query is None
+
+
+def test_normalise_filters_reuses_default_filters():
+    first = normalise_filters(statuses=("PENDING",), sort_by="created_at", sort_order="asc", limit=5)
+    second = normalise_filters(statuses=("PENDING",), sort_by="created_at", sort_order="asc", limit=5)
+
+    assert first is second
+    assert first == HomeFilters(None, ("PENDING",), None, None, "created_at", "asc", 5, 0, None)
+    assert normalise_filters(statuses=("PENDING",), sort_by="created_at", sort_order="asc", limit=6) is not first
+
+
+def test_normalise_filters_cached_statuses_are_immutable():
+    first = normalise_filters(statuses=("APPROVED",), limit=7)
+
+    assert isinstance(first.statuses, tuple)
+    with pytest.raises(AttributeError):
+        first.statuses.append("REJECTED")  # type: ignore[union-attr]
+    assert normalise_filters(statuses=("APPROVED",), limit=7).statuses == ("APPROVED",)
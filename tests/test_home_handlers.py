@@ -1,20 +1,16 @@
-from contextlib import contextmanager
-from pathlib import Path
 from types import SimpleNamespace
-import sys
 
+import pytest
 from slack_sdk.errors import SlackApiError
 from slack_sdk.web.slack_response import SlackResponse
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:  # pragma: no cover
-    sys.path.insert(0, str(ROOT))
-
-import app as app_module  # noqa: E402
-from slack_workflow_engine.home.filters import HomeFilters  # noqa: E402
+import app as app_module
+from slack_workflow_engine.home.filters import HomeFilters
 
 
 class DummyBoltApp:
+    __slots__ = ("events", "actions")
+
     def __init__(self) -> None:
         self.events = {}
         self.actions = {}
@@ -33,7 +29,28 @@ class DummyBoltApp:
 
         return decorator
 
+
+class FakeSessionScope:
+    """Callable stand-in for ``session_scope`` that hands out a fixed session."""
+
+    __slots__ = ("session",)
+
+    def __init__(self, session=None) -> None:
+        self.session = session
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        return self.session
+
+    def __exit__(self, *exc_info):
+        return False
+
+
 class SpyDebouncer:
+    __slots__ = ("should_publish_result", "calls", "cleared")
+
     def __init__(self, should_publish: bool) -> None:
         self.should_publish_result = should_publish
         self.calls = []
@@ -46,18 +63,13 @@ class SpyDebouncer:
         self.cleared = user_id
 
 
-class DummyClient:
-    def __init__(self) -> None:
-        self.calls = []
-
-    def views_publish(self, *, user_id, view):
-        self.calls.append({"user_id": user_id, "view": view})
+class RecordingStructLogger:
+    __slots__ = ("info_calls", "error_calls", "bind_calls")
 
-
-class RecordingLogger:
     def __init__(self) -> None:
         self.info_calls = []
         self.error_calls = []
+        self.bind_calls = []
 
     def info(self, message, **kwargs):
         self.info_calls.append((message, kwargs))
@@ -65,17 +77,18 @@ class RecordingLogger:
     def error(self, message, **kwargs):
         self.error_calls.append((message, kwargs))
 
-
-class RecordingStructLogger(RecordingLogger):
-    def __init__(self) -> None:
-        super().__init__()
-        self.bind_calls = []
-
     def bind(self, **kwargs):
         self.bind_calls.append(kwargs)
         return self
 
 
+@pytest.fixture
+def struct_logger(monkeypatch):
+    logger = RecordingStructLogger()
+    monkeypatch.setattr(app_module.structlog, "get_logger", lambda: logger)
+    return logger
+
+
 def _register_handler(
     monkeypatch,
     debouncer,
@@ -89,8 +102,22 @@ def _register_handler(
 ):
     monkeypatch.setattr(app_module, "HOME_DEBOUNCER", debouncer)
     monkeypatch.setattr(app_module, "session_scope", session_scope)
-    monkeypatch.setattr(app_module, "list_recent_requests", recent_fn)
-    monkeypatch.setattr(app_module, "list_pending_approvals", pending_fn)
+
+    def fake_list_home_bundles(
+        session,
+        *,
+        user_id,
+        approver_id,
+        recent_filters,
+        pending_filters,
+        recent_limit,
+        pending_limit,
+    ):
+        recent = recent_fn(session, user_id=user_id, limit=recent_limit, query=recent_filters.query)
+        pending = pending_fn(session, approver_id=approver_id, limit=pending_limit, query=pending_filters.query)
+        return recent, pending
+
+    monkeypatch.setattr(app_module, "list_home_bundles", fake_list_home_bundles)
     monkeypatch.setattr(app_module, "build_home_view", build_view)
     monkeypatch.setattr(app_module, "get_settings", lambda: settings)
 
@@ -111,14 +138,12 @@ def _register_handler(
     return handler
 
 
-def test_home_handler_publishes_when_not_debounced(monkeypatch):
+def test_home_handler_publishes_when_not_debounced(monkeypatch, dummy_client, recording_logger, struct_logger):
     debouncer = SpyDebouncer(should_publish=True)
 
     dummy_session = object()
 
-    @contextmanager
-    def fake_session_scope():
-        yield dummy_session
+    fake_scope = FakeSessionScope(dummy_session)
 
     recent_calls = []
     pending_calls = []
@@ -137,13 +162,10 @@ def test_home_handler_publishes_when_not_debounced(monkeypatch):
         view_calls.append((my_requests, pending_approvals, kwargs))
         return {"type": "home", "blocks": []}
 
-    struct_logger = RecordingStructLogger()
-    monkeypatch.setattr(app_module.structlog, "get_logger", lambda: struct_logger)
-
     handler = _register_handler(
         monkeypatch,
         debouncer,
-        session_scope=fake_session_scope,
+        session_scope=fake_scope,
         recent_fn=fake_recent,
         pending_fn=fake_pending,
         build_view=fake_build_view,
@@ -154,10 +176,7 @@ def test_home_handler_publishes_when_not_debounced(monkeypatch):
         ),
     )
 
-    client = DummyClient()
-    logger = RecordingLogger()
-
-    handler(event={"user": "U123"}, client=client, logger=logger)
+    handler(event={"user": "U123"}, client=dummy_client, logger=recording_logger)
 
     assert debouncer.calls == ["U123"]
     assert recent_calls == [(dummy_session, "U123", 6)]
@@ -169,25 +188,21 @@ def test_home_handler_publishes_when_not_debounced(monkeypatch):
     assert kwargs["pending_filters"].limit == 7
     assert kwargs["my_pagination"].has_more is False
     assert kwargs["pending_pagination"].has_more is False
-    assert client.calls == [{"user_id": "U123", "view": {"type": "home", "blocks": []}}]
+    assert dummy_client.publish_calls == [{"user_id": "U123", "view": {"type": "home", "blocks": []}}]
     assert any(message == "app_home_data_prepared" and kwargs == {"recent_count": 1, "pending_count": 1} for message, kwargs in struct_logger.info_calls)
 
 
-def test_home_handler_skips_publish_when_debounced(monkeypatch):
+def test_home_handler_skips_publish_when_debounced(monkeypatch, dummy_client, recording_logger):
     debouncer = SpyDebouncer(should_publish=False)
     monkeypatch.setattr(app_module, "HOME_DEBOUNCER", debouncer)
 
     def fail(*args, **kwargs):  # pragma: no cover - sanity check
         raise AssertionError("Should not be called when debounced")
 
-    @contextmanager
-    def fake_scope():
-        yield None
-
     handler = _register_handler(
         monkeypatch,
         debouncer,
-        session_scope=fake_scope,
+        session_scope=FakeSessionScope(),
         recent_fn=fail,
         pending_fn=fail,
         build_view=fail,
@@ -195,29 +210,19 @@ def test_home_handler_skips_publish_when_debounced(monkeypatch):
         filter_results=(HomeFilters(None, None, None, None, "created_at", "desc", 10, 0, None),),
     )
 
-    client = DummyClient()
-    logger = RecordingLogger()
-
-    handler(event={"user": "U123"}, client=client, logger=logger)
+    handler(event={"user": "U123"}, client=dummy_client, logger=recording_logger)
 
     assert debouncer.calls == ["U123"]
-    assert client.calls == []
+    assert dummy_client.publish_calls == []
 
 
-def test_home_handler_handles_empty_data(monkeypatch):
+def test_home_handler_handles_empty_data(monkeypatch, dummy_client, recording_logger, struct_logger):
     debouncer = SpyDebouncer(should_publish=True)
 
-    @contextmanager
-    def fake_scope():
-        yield None
-
-    struct_logger = RecordingStructLogger()
-    monkeypatch.setattr(app_module.structlog, "get_logger", lambda: struct_logger)
-
     handler = _register_handler(
         monkeypatch,
         debouncer,
-        session_scope=fake_scope,
+        session_scope=FakeSessionScope(),
         recent_fn=lambda *_, **__: [],
         pending_fn=lambda *_, **__: [],
         build_view=lambda *, my_requests, pending_approvals, **kwargs: {
@@ -231,30 +236,19 @@ def test_home_handler_handles_empty_data(monkeypatch):
         ),
     )
 
-    client = DummyClient()
-    logger = RecordingLogger()
-
-    handler(event={"user": "U456"}, client=client, logger=logger)
+    handler(event={"user": "U456"}, client=dummy_client, logger=recording_logger)
 
-    assert client.calls == [{"user_id": "U456", "view": {"type": "home", "blocks": [[], []]}}]
+    assert dummy_client.publish_calls == [{"user_id": "U456", "view": {"type": "home", "blocks": [[], []]}}]
     assert any(message == "app_home_data_prepared" and kwargs == {"recent_count": 0, "pending_count": 0} for message, kwargs in struct_logger.info_calls)
 
 
-def test_home_handler_logs_on_slack_error(monkeypatch):
+def test_home_handler_logs_on_slack_error(monkeypatch, recording_logger, struct_logger):
     debouncer = SpyDebouncer(should_publish=True)
 
-    @contextmanager
-    def fake_scope():
-        yield None
-
-    error_logger = RecordingLogger()
-    struct_logger = RecordingStructLogger()
-    monkeypatch.setattr(app_module.structlog, "get_logger", lambda: struct_logger)
-
     handler = _register_handler(
         monkeypatch,
         debouncer,
-        session_scope=fake_scope,
+        session_scope=FakeSessionScope(),
         recent_fn=lambda *_, **__: [],
         pending_fn=lambda *_, **__: [],
         build_view=lambda **_: {"type": "home", "blocks": []},
@@ -265,7 +259,7 @@ def test_home_handler_logs_on_slack_error(monkeypatch):
         ),
     )
 
-    class FailingClient(DummyClient):
+    class FailingClient:
         def views_publish(self, *, user_id, view):
             response = SlackResponse(
                 client=None,
@@ -280,20 +274,18 @@ def test_home_handler_logs_on_slack_error(monkeypatch):
 
     client = FailingClient()
 
-    handler(event={"user": "U789"}, client=client, logger=error_logger)
+    handler(event={"user": "U789"}, client=client, logger=recording_logger)
 
     assert any(message == "app_home_publish_failed" for message, _ in struct_logger.error_calls)
-    assert any(message == "Failed to publish App Home view" for message, _ in error_logger.error_calls)
+    assert any(args[0] == "Failed to publish App Home view" for args, _ in recording_logger.errors)
 
 
-def test_home_search_action_publishes(monkeypatch):
+def test_home_search_action_publishes(monkeypatch, dummy_client, recording_logger, struct_logger):
     debouncer = SpyDebouncer(should_publish=True)
 
     dummy_session = object()
 
-    @contextmanager
-    def fake_scope():
-        yield dummy_session
+    fake_scope = FakeSessionScope(dummy_session)
 
     recent_calls = []
     pending_calls = []
@@ -313,9 +305,6 @@ def test_home_search_action_publishes(monkeypatch):
             "search": kwargs["my_filters"].query,
         }
 
-    struct_logger = RecordingStructLogger()
-    monkeypatch.setattr(app_module.structlog, "get_logger", lambda: struct_logger)
-
     handler = _register_handler(
         monkeypatch,
         debouncer,
@@ -338,18 +327,15 @@ def test_home_search_action_publishes(monkeypatch):
     def ack(payload=None):
         ack_calls.append(payload)
 
-    client = DummyClient()
-    logger = RecordingLogger()
-
     search_handler(
         ack=ack,
         body={"user": {"id": "U123"}, "actions": [{"value": " match "}]},
-        client=client,
-        logger=logger,
+        client=dummy_client,
+        logger=recording_logger,
     )
 
     assert ack_calls == [None]
-    assert client.calls == [
+    assert dummy_client.publish_calls == [
         {
             "user_id": "U123",
             "view": {
@@ -362,3 +348,19 @@ def test_home_search_action_publishes(monkeypatch):
     assert recent_calls == [(dummy_session, "U123", 6, "match")]
     assert pending_calls == [(dummy_session, "U123", 6, "match")]
     assert any(message == "home_search_performed" for message, _ in struct_logger.info_calls)
+
+
+def test_paginate_trims_probe_row():
+    filters = HomeFilters(None, None, None, None, "created_at", "desc", 2, 4, None)
+
+    rows, pagination = app_module._paginate([1, 2, 3], filters)
+
+    assert rows == [1, 2]
+    assert pagination.has_more is True
+    assert pagination.has_previous is True
+    assert (pagination.offset, pagination.limit) == (4, 2)
+
+    rows, pagination = app_module._paginate([1, 2], filters)
+
+    assert rows == [1, 2]
+    assert pagination.has_more is False
@@ -1,12 +1,6 @@
 from datetime import UTC, datetime
-from pathlib import Path
-import sys
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:  # pragma: no cover
-    sys.path.insert(0, str(ROOT))
-
-from slack_workflow_engine.home import (  # noqa: E402
+from slack_workflow_engine.home import (
     PaginationState,
     RequestSummary,
     build_home_placeholder_view,
@@ -15,7 +9,7 @@ from slack_workflow_engine.home import (  # noqa: E402
     HOME_REJECT_ACTION_ID,
     HOME_SEARCH_BLOCK_ID,
 )
-from slack_workflow_engine.home.filters import HomeFilters  # noqa: E402
+from slack_workflow_engine.home.filters import HomeFilters
 
 
 def test_build_home_view_populates_sections() -> None:
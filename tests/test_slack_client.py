@@ -1,15 +1,8 @@
 """Unit tests for the Slack WebClient wrapper."""
 
-from pathlib import Path
-import sys
-
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from slack_workflow_engine.slack_client import SlackClient  # noqa: E402
+from slack_workflow_engine.slack_client import SlackClient
 
 
 class DummyWebClient:
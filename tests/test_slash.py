@@ -1,31 +1,19 @@
 """Tests for workflow modal builder and slash command."""
 
-import json
-from pathlib import Path
-import sys
-
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-import app as app_module  # noqa: E402
-from slack_workflow_engine import config  # noqa: E402
-from slack_workflow_engine.workflows import build_modal_view  # noqa: E402
-from slack_workflow_engine.workflows.models import WorkflowDefinition  # noqa: E402
+import app as app_module
+from slack_workflow_engine.workflows import build_modal_view
+from slack_workflow_engine.workflows.models import WorkflowDefinition
 
 
-@pytest.fixture
-def settings_env(monkeypatch, tmp_path):
-    db_path = tmp_path / "test.db"
-    monkeypatch.setenv("SLACK_BOT_TOKEN", "token")
-    monkeypatch.setenv("SLACK_SIGNING_SECRET", "secret")
-    monkeypatch.setenv("APPROVER_USER_IDS", "U1,U2")
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
-    config.get_settings.cache_clear()
-    yield tmp_path
-    config.get_settings.cache_clear()
+REFUND_WORKFLOW = {
+    "type": "refund",
+    "title": "Refund",
+    "fields": [{"name": "amount", "label": "Amount", "type": "number"}],
+    "approvers": {"strategy": "sequential", "levels": [["U1"]]},
+    "notify_channel": "CREFUND",
+}
 
 
 @pytest.fixture
@@ -54,18 +42,7 @@ def test_build_modal_view_constructs_all_fields(workflow_definition):
     assert first_block["element"]["type"] == "plain_text_input"
 
 
-def test_slash_command_opens_modal(monkeypatch, settings_env):
-    workflows_dir = settings_env / "workflows"
-    workflows_dir.mkdir()
-    data = {
-        "type": "refund",
-        "title": "Refund",
-        "fields": [{"name": "amount", "label": "Amount", "type": "number"}],
-        "approvers": {"strategy": "sequential", "levels": [["U1"]]},
-        "notify_channel": "CREFUND",
-    }
-    (workflows_dir / "refund.json").write_text(json.dumps(data), encoding="utf-8")
-
+def test_slash_command_opens_modal(monkeypatch, workflows_dir, bolt_logger, sync_run_async):
     monkeypatch.setattr(app_module, "WORKFLOW_DEFINITION_DIR", workflows_dir)
 
     client_calls = []
@@ -80,22 +57,14 @@ def test_slash_command_opens_modal(monkeypatch, settings_env):
         ack_calls.append(payload)
 
     command = {"text": "refund", "trigger_id": "123.456"}
-    logger = app_module._create_bolt_app(config.get_settings()).logger
-
-    def immediate_run(func, *args, **kwargs):
-        func(*args, **kwargs)
-
-    monkeypatch.setattr(app_module, "run_async", immediate_run)
 
-    app_module._handle_request_command(ack=ack, command=command, client=DummyClient(), logger=logger)
+    app_module._handle_request_command(ack=ack, command=command, client=DummyClient(), logger=bolt_logger)
 
     assert ack_calls == [None]
     assert client_calls  # ensure modal scheduling occurred
 
 
-def test_slash_command_unknown_workflow(monkeypatch, settings_env):
-    workflows_dir = settings_env / "workflows"
-    workflows_dir.mkdir()
+def test_slash_command_unknown_workflow(monkeypatch, workflows_dir, bolt_logger):
     monkeypatch.setattr(app_module, "WORKFLOW_DEFINITION_DIR", workflows_dir)
 
     ack_payload = {}
@@ -104,8 +73,7 @@ def test_slash_command_unknown_workflow(monkeypatch, settings_env):
         ack_payload.update(payload or {})
 
     command = {"text": "missing", "trigger_id": "123"}
-    logger = app_module._create_bolt_app(config.get_settings()).logger
 
-    app_module._handle_request_command(ack=ack, command=command, client=None, logger=logger)
+    app_module._handle_request_command(ack=ack, command=command, client=None, logger=bolt_logger)
 
     assert "Workflow `missing` is not configured." in ack_payload["text"]
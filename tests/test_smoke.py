@@ -2,24 +2,31 @@
 
 from contextlib import contextmanager
 from importlib import reload
-from pathlib import Path
-import sys
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:  # pragma: no cover - import-time guard
-    sys.path.insert(0, str(ROOT))
+import pytest
+import structlog
 
-import app as app_module  # noqa: E402  (import after path adjustment)
-from slack_workflow_engine import config  # noqa: E402
+import app as app_module
+from slack_workflow_engine import config
 
 
-def test_health_endpoint_returns_ok(monkeypatch):
+@pytest.fixture
+def smoke_env(monkeypatch):
     monkeypatch.setenv("SLACK_BOT_TOKEN", "test-token")
     monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
     monkeypatch.setenv("APPROVER_USER_IDS", "U111,U222")
-    monkeypatch.setenv("DATABASE_URL", "sqlite:///test.db")
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///:memory:")
     config.get_settings.cache_clear()
+    # create_app installs the production JSON logging setup; keep the test one afterwards.
+    structlog_config = structlog.get_config()
 
+    yield
+
+    structlog.configure(**structlog_config)
+    config.get_settings.cache_clear()
+
+
+def test_health_endpoint_returns_ok(smoke_env):
     reload(app_module)
     flask_app = app_module.create_app()
 
@@ -33,13 +40,7 @@ def test_health_endpoint_returns_ok(monkeypatch):
         assert "version" in data
 
 
-def test_health_endpoint_reports_db_down(monkeypatch):
-    monkeypatch.setenv("SLACK_BOT_TOKEN", "test-token")
-    monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
-    monkeypatch.setenv("APPROVER_USER_IDS", "U111,U222")
-    monkeypatch.setenv("DATABASE_URL", "sqlite:///test.db")
-    config.get_settings.cache_clear()
-
+def test_health_endpoint_reports_db_down(monkeypatch, smoke_env):
     reload(app_module)
     flask_app = app_module.create_app()
 
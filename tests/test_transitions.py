@@ -1,17 +1,10 @@
 """Tests for request status transitions."""
 
-from pathlib import Path
-import sys
 from datetime import UTC, datetime
 
 import pytest
+from sqlalchemy import select
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from slack_workflow_engine import config
-from slack_workflow_engine.db import Base, get_engine, get_session_factory
 from slack_workflow_engine.models import (
     OptimisticLockError,
     Request,
@@ -21,35 +14,18 @@ from slack_workflow_engine.models import (
 )
 
 
-@pytest.fixture(autouse=True)
-def setup_database(monkeypatch, tmp_path):
-    db_path = tmp_path / "transitions.db"
-    monkeypatch.setenv("SLACK_BOT_TOKEN", "token")
-    monkeypatch.setenv("SLACK_SIGNING_SECRET", "secret")
-    monkeypatch.setenv("APPROVER_USER_IDS", "U1,U2")
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
-
-    engine = get_engine()
-    Base.metadata.create_all(engine)
-
-    yield
-
-    Base.metadata.drop_all(engine)
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
-
-
 @pytest.fixture
-def session(setup_database):
-    factory = get_session_factory()
-    with factory() as session:
+def session(db_session_factory):
+    with db_session_factory() as session:
         yield session
 
 
+@pytest.fixture(params=[True, False], ids=["returning", "refresh"])
+def update_returning(request, shared_engine, monkeypatch):
+    monkeypatch.setattr(shared_engine.dialect, "update_returning", request.param)
+    return request.param
+
+
 @pytest.fixture
 def persisted_request(session):
     request = Request(
@@ -60,12 +36,12 @@ def persisted_request(session):
         request_key="key-1",
     )
     session.add(request)
+    # The session keeps loaded state across commits, so the flushed id and defaults need no reload.
     session.commit()
-    session.refresh(request)
     return request
 
 
-def test_valid_transition_advances_status(session, persisted_request):
+def test_valid_transition_advances_status(session, persisted_request, update_returning):
     updated = advance_request_status(
         session,
         persisted_request,
@@ -78,13 +54,21 @@ def test_valid_transition_advances_status(session, persisted_request):
     assert updated.version == 2
     assert updated.decided_by == "U2"
 
-    history_entries = session.query(StatusHistory).filter_by(request_id=persisted_request.id).all()
+    history_entries = session.scalars(select(StatusHistory).filter_by(request_id=persisted_request.id)).all()
     assert len(history_entries) == 1
     assert history_entries[0].from_status == "PENDING"
     assert history_entries[0].to_status == "APPROVED"
     assert history_entries[0].changed_by == "U2"
 
 
+def test_transition_refreshes_loaded_history(session, persisted_request):
+    assert persisted_request.status_history == []
+
+    advance_request_status(session, persisted_request, new_status="APPROVED", decided_by="U2")
+
+    assert [entry.to_status for entry in persisted_request.status_history] == ["APPROVED"]
+
+
 def test_invalid_transition_raises_error(session, persisted_request):
     with pytest.raises(StatusTransitionError):
         advance_request_status(
@@ -95,8 +79,8 @@ def test_invalid_transition_raises_error(session, persisted_request):
         )
 
 
-def test_optimistic_lock_detects_concurrent_update(setup_database):
-    factory = get_session_factory()
+def test_optimistic_lock_detects_concurrent_update(db_session_factory, update_returning):
+    factory = db_session_factory
     with factory() as session1:
         req = Request(
             type="refund",
@@ -107,9 +91,9 @@ def test_optimistic_lock_detects_concurrent_update(setup_database):
         )
         session1.add(req)
         session1.commit()
-        session1.refresh(req)
-        request_id = req.id
 
+        # Both sessions share the test connection as SAVEPOINTs, so session2
+        # must open its savepoint before session1 starts the competing update.
         with factory() as session2:
             same_req_session2 = session2.get(Request, req.id)
 
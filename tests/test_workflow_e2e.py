@@ -1,99 +1,50 @@
 """Integration-style tests for request submission, approval, and rejection flows."""
 
 import json
-from pathlib import Path
-import sys
 
 import pytest
+from sqlalchemy import func, select
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import app as app_module
+from slack_workflow_engine.actions import encode_action_value
+from slack_workflow_engine.models import ApprovalDecision, Message, Request
 
-import app as app_module  # noqa: E402
-from slack_workflow_engine import config  # noqa: E402
-from slack_workflow_engine.db import Base, get_engine, get_session_factory  # noqa: E402
-from slack_workflow_engine.models import ApprovalDecision, Message, Request  # noqa: E402
 
+REFUND_WORKFLOW = {
+    "type": "refund",
+    "title": "Refund",
+    "fields": [
+        {"name": "order_id", "label": "Order ID", "type": "text", "required": True},
+        {"name": "amount", "label": "Amount", "type": "number"},
+    ],
+    "approvers": {"strategy": "sequential", "levels": [{"members": ["U1"], "quorum": 1}, {"members": ["U2"], "quorum": 1}]},
+    "notify_channel": "CREFUND",
+}
 
-@pytest.fixture(autouse=True)
-def configure_environment(monkeypatch, tmp_path):
-    db_path = tmp_path / "e2e.db"
-    workflows_dir = tmp_path / "workflows"
-    workflows_dir.mkdir()
-    workflow = {
-        "type": "refund",
-        "title": "Refund",
-        "fields": [
-            {"name": "order_id", "label": "Order ID", "type": "text", "required": True},
-            {"name": "amount", "label": "Amount", "type": "number"},
-        ],
-        "approvers": {"strategy": "sequential", "levels": [{"members": ["U1"], "quorum": 1}, {"members": ["U2"], "quorum": 1}]},
-        "notify_channel": "CREFUND",
-    }
-    (workflows_dir / "refund.json").write_text(json.dumps(workflow), encoding="utf-8")
-
-    monkeypatch.setenv("SLACK_BOT_TOKEN", "token")
-    monkeypatch.setenv("SLACK_SIGNING_SECRET", "secret")
-    monkeypatch.setenv("APPROVER_USER_IDS", "U1,U2")
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
-
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
 
+@pytest.fixture(autouse=True)
+def configure_environment(monkeypatch, workflows_dir, db_session_factory):
     from slack_workflow_engine import workflows as workflow_pkg
     from slack_workflow_engine.workflows import commands as workflow_commands
-    from slack_workflow_engine.workflows import loader as workflow_loader
 
     monkeypatch.setattr(app_module, "WORKFLOW_DEFINITION_DIR", workflows_dir)
     monkeypatch.setattr(workflow_pkg, "WORKFLOW_DEFINITION_DIR", workflows_dir)
     monkeypatch.setattr(workflow_commands, "WORKFLOW_DEFINITION_DIR", workflows_dir)
-    workflow_loader.load_workflow_definition.cache_clear()
-
-    engine = get_engine()
-    Base.metadata.create_all(engine)
-
-    yield
-
-    Base.metadata.drop_all(engine)
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
-
-
-class DummySlackClient:
-    def __init__(self):
-        self.post_calls = []
-        self.update_calls = []
-        self.publish_calls = []
-
-    def chat_postMessage(self, **kwargs):
-        self.post_calls.append(kwargs)
-        return {
-            "ok": True,
-            "channel": kwargs["channel"],
-            "ts": "1700000000.000100",
-            "message": {"thread_ts": "1700000000.000100"},
-        }
 
-    def chat_update(self, **kwargs):
-        self.update_calls.append(kwargs)
-        return {"ok": True}
 
-    def views_publish(self, **kwargs):
-        self.publish_calls.append(kwargs)
-        return {"ok": True}
-
-
-def test_submit_and_approve_flow(monkeypatch):
-    bolt_logger = app_module._create_bolt_app(config.get_settings()).logger
-    slack_client = DummySlackClient()
+def _action_body(request_id, *, user_id, level):
+    return {
+        "user": {"id": user_id},
+        "actions": [
+            {
+                "value": encode_action_value(request_id, "refund", level),
+            }
+        ],
+    }
 
-    def immediate_async(func, /, *args, **kwargs):
-        return func(*args, **kwargs)
 
-    monkeypatch.setattr(app_module, "run_async", immediate_async)
+def _submit_and_approve_level1(slack_client, logger, factory):
+    """Submit a refund and approve its first level, returning the request id."""
 
     ack_payloads = []
 
@@ -117,25 +68,16 @@ def test_submit_and_approve_flow(monkeypatch):
         ack=ack,
         body=body,
         client=slack_client,
-        logger=bolt_logger,
+        logger=logger,
     )
 
     assert ack_payloads == [{"response_action": "clear"}]
     assert slack_client.post_calls
 
-    factory = get_session_factory()
     with factory() as session:
-        request = session.query(Request).one()
+        request = session.scalars(select(Request).limit(2)).one()
         assert request.status == "PENDING_L1"
-        message = session.query(Message).one()
-    level1_action = {
-        "user": {"id": "U1"},
-        "actions": [
-            {
-                "value": json.dumps({"request_id": request.id, "workflow_type": "refund", "level": 1}),
-            }
-        ],
-    }
+        session.scalars(select(Message).limit(2)).one()
 
     ack_calls = []
 
@@ -144,152 +86,78 @@ def test_submit_and_approve_flow(monkeypatch):
 
     app_module._handle_approve_action(
         ack=ack_action,
-        body=level1_action,
+        body=_action_body(request.id, user_id="U1", level=1),
         client=slack_client,
-        logger=bolt_logger,
+        logger=logger,
     )
 
     assert ack_calls == [{"response_type": "ephemeral", "text": "Request approved."}]
     assert slack_client.update_calls
-    publish_targets = {call["user_id"] for call in slack_client.publish_calls}
-    assert {"U1", "U123", "U2"}.issubset(publish_targets)
+    assert {"U1", "U123", "U2"} <= slack_client.publish_user_ids
 
     with factory() as session:
         mid_state = session.get(Request, request.id)
         assert mid_state.status == "PENDING_L2"
         assert mid_state.decided_by == "U1"
 
-    level2_action = {
-        "user": {"id": "U2"},
-        "actions": [
-            {
-                "value": json.dumps({"request_id": request.id, "workflow_type": "refund", "level": 2}),
-            }
-        ],
-    }
-
-    final_ack_calls: list = []
-
-    def ack_action_level2(payload=None):
-        final_ack_calls.append(payload)
-
-    app_module._handle_approve_action(
-        ack=ack_action_level2,
-        body=level2_action,
-        client=slack_client,
-        logger=bolt_logger,
-    )
-
-    assert final_ack_calls == [{"response_type": "ephemeral", "text": "Request approved."}]
-
-    with factory() as session:
-        refreshed = session.get(Request, request.id)
-        assert refreshed.status == "APPROVED"
-        assert refreshed.decided_by == "U2"
-        approvals = session.query(ApprovalDecision).filter_by(request_id=request.id).all()
-        assert {decision.level for decision in approvals} == {1, 2}
-        assert approvals[-1].decision == "APPROVED"
-        assert approvals[-1].reason is None
-        assert approvals[-1].source == "channel"
-
-
-def test_submit_and_reject_flow(monkeypatch):
-    bolt_logger = app_module._create_bolt_app(config.get_settings()).logger
-    slack_client = DummySlackClient()
-
-    def immediate_async(func, /, *args, **kwargs):
-        return func(*args, **kwargs)
-
-    monkeypatch.setattr(app_module, "run_async", immediate_async)
-
-    ack_payloads = []
-
-    def ack(payload=None):
-        ack_payloads.append(payload)
-
-    body = {
-        "user": {"id": "U123"},
-        "view": {
-            "private_metadata": json.dumps({"workflow_type": "refund"}),
-            "state": {
-                "values": {
-                    "order_id": {"order_id": {"value": "INV-002"}},
-                    "amount": {"amount": {"value": "999"}},
-                }
-            },
-        },
-    }
-
-    app_module._handle_view_submission(
-        ack=ack,
-        body=body,
-        client=slack_client,
-        logger=bolt_logger,
-    )
-
-    assert ack_payloads == [{"response_action": "clear"}]
-
-    factory = get_session_factory()
-    with factory() as session:
-        request = session.query(Request).one()
-        assert request.status == "PENDING_L1"
-
+    return request.id
+
+
+@pytest.mark.parametrize(
+    ("handler_name", "decision", "reason", "ack_text"),
+    [
+        pytest.param("_handle_approve_action", "APPROVED", None, "Request approved.", id="approve"),
+        pytest.param("_handle_reject_action", "REJECTED", "Budget exceeded", "Request rejected.", id="reject"),
+    ],
+)
+def test_submit_and_decide_flow(
+    bolt_logger, dummy_client, sync_run_async, db_session_factory, handler_name, decision, reason, ack_text
+):
+    slack_client = dummy_client
+    factory = db_session_factory
+    request_id = _submit_and_approve_level1(slack_client, bolt_logger, factory)
+
+    level2_body = _action_body(request_id, user_id="U2", level=2)
+    if reason is not None:
+        level2_body["state"] = {"values": {"reason_block": {"reason": {"value": reason}}}}
+
+    updates_before = len(slack_client.update_calls)
+    slack_client.publish_user_ids.clear()
     ack_calls = []
 
-    level1_action = {
-        "user": {"id": "U1"},
-        "actions": [
-            {
-                "value": json.dumps({"request_id": request.id, "workflow_type": "refund", "level": 1}),
-            }
-        ],
-    }
-
-    app_module._handle_approve_action(
-        ack=lambda payload=None: None,
-        body=level1_action,
-        client=slack_client,
-        logger=bolt_logger,
-    )
-
     def ack_action(payload=None):
         ack_calls.append(payload)
 
-    rejection_body = {
-        "user": {"id": "U2"},
-        "actions": [
-            {
-                "value": json.dumps({"request_id": request.id, "workflow_type": "refund", "level": 2}),
-            }
-        ],
-        "state": {
-            "values": {
-                "reason_block": {"reason": {"value": "Budget exceeded"}},
-            }
-        },
-    }
-
-    app_module._handle_reject_action(
+    getattr(app_module, handler_name)(
         ack=ack_action,
-        body=rejection_body,
+        body=level2_body,
         client=slack_client,
         logger=bolt_logger,
     )
 
-    assert ack_calls == [{"response_type": "ephemeral", "text": "Request rejected."}]
-    assert slack_client.update_calls
-    publish_targets = {call["user_id"] for call in slack_client.publish_calls}
-    assert {"U1", "U2", "U123"}.issubset(publish_targets)
-    reason_payload = json.dumps(slack_client.update_calls[-1]["blocks"])
-    assert "Budget exceeded" in reason_payload
+    assert ack_calls == [{"response_type": "ephemeral", "text": ack_text}]
+    assert len(slack_client.update_calls) > updates_before
+    assert {"U2", "U123"} <= slack_client.publish_user_ids
+    if reason is not None:
+        reason_block = slack_client.update_calls[-1]["blocks"][-1]
+        assert reason in reason_block["text"]["text"]
 
     with factory() as session:
-        refreshed = session.get(Request, request.id)
-        assert refreshed.status == "REJECTED"
-        assert refreshed.decided_by == "U2"
-        approvals = session.query(ApprovalDecision).filter_by(request_id=request.id).all()
-        assert {decision.level for decision in approvals} == {1, 2}
-        final = approvals[-1]
-        assert final.decision == "REJECTED"
-        assert final.reason == "Budget exceeded"
-        assert final.source == "channel"
+        # The request, its latest approval and the approval count in one row.
+        final = session.execute(
+            select(
+                Request.status,
+                Request.decided_by,
+                ApprovalDecision.level,
+                ApprovalDecision.decision,
+                ApprovalDecision.reason,
+                ApprovalDecision.source,
+                func.count(ApprovalDecision.id).over(),
+            )
+            .join(ApprovalDecision, ApprovalDecision.request_id == Request.id)
+            .where(Request.id == request_id)
+            .order_by(ApprovalDecision.level.desc())
+            .limit(1)
+        ).one()
+
+    assert tuple(final) == (decision, "U2", 2, decision, reason, "channel", 2)
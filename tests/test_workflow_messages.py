@@ -1,36 +1,38 @@
 """Tests for workflow request message builders."""
 
 import json
-from pathlib import Path
-import sys
 
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from slack_workflow_engine.workflows import (  # noqa: E402
+from slack_workflow_engine.workflows import (
     WorkflowDefinition,
     build_request_message,
     build_request_decision_update,
     FieldDefinition,
     ApproverConfig,
+    ApproverLevel,
     APPROVE_ACTION_ID,
     REJECT_ACTION_ID,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def workflow_definition():
-    return WorkflowDefinition(
+    # Trusted literal data: build the models directly instead of running the validators.
+    return WorkflowDefinition.model_construct(
         type="refund",
         title="Refund Request",
         fields=[
-            FieldDefinition(name="order_id", label="Order ID", type="text", required=True),
-            FieldDefinition(name="amount", label="Amount", type="number"),
+            FieldDefinition.model_construct(name="order_id", label="Order ID", type="text", required=True),
+            FieldDefinition.model_construct(name="amount", label="Amount", type="number"),
         ],
-        approvers=ApproverConfig(strategy="sequential", levels=[["U1"], ["U2"]]),
+        approvers=ApproverConfig.model_construct(
+            strategy="sequential",
+            levels=[
+                ApproverLevel.model_construct(members=["U1"], quorum=1),
+                ApproverLevel.model_construct(members=["U2"], quorum=1),
+            ],
+        ),
         notify_channel="CREFUND",
     )
 
@@ -1,13 +1,6 @@
-from pathlib import Path
-import sys
-
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:  # pragma: no cover
-    sys.path.insert(0, str(ROOT))
-
-from slack_workflow_engine.workflows.models import ApproverConfig  # noqa: E402
+from slack_workflow_engine.workflows.models import ApproverConfig
 
 
 def test_approver_config_accepts_legacy_list() -> None:
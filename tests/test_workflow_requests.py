@@ -1,23 +1,17 @@
 """Tests for workflow submission parsing and canonicalisation."""
 
 import json
-from pathlib import Path
-import sys
 
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from slack_workflow_engine.workflows.models import WorkflowDefinition  # noqa: E402
-from slack_workflow_engine.workflows.requests import (  # noqa: E402
+from slack_workflow_engine.workflows.models import WorkflowDefinition
+from slack_workflow_engine.workflows.requests import (
     canonical_json,
     parse_submission,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def workflow_definition():
     return WorkflowDefinition(
         type="demo",
@@ -32,16 +26,17 @@ def workflow_definition():
     )
 
 
-def test_parse_submission_normalises_values(workflow_definition):
-    state = {
-        "values": {
-            "order_id": {"order_id": {"value": " 12345 "}},
-            "amount": {"amount": {"value": "42.50"}},
-            "note": {"note": {"value": "  Hello world  "}},
-        }
-    }
+def _state(**values):
+    """Build Slack modal state where each block id matches its action id."""
 
-    parsed = parse_submission(state, workflow_definition)
+    return {"values": {name: {name: {"value": value}} for name, value in values.items()}}
+
+
+def test_parse_submission_normalises_values(workflow_definition):
+    parsed = parse_submission(
+        _state(order_id=" 12345 ", amount="42.50", note="  Hello world  "),
+        workflow_definition,
+    )
 
     assert parsed["order_id"] == "12345"
     assert parsed["amount"] == 42.50
@@ -49,10 +44,8 @@ def test_parse_submission_normalises_values(workflow_definition):
 
 
 def test_parse_submission_missing_required_field(workflow_definition):
-    state = {"values": {"amount": {"amount": {"value": "100"}}}}
-
     with pytest.raises(ValueError) as err:
-        parse_submission(state, workflow_definition)
+        parse_submission(_state(amount="100"), workflow_definition)
 
     assert "order_id" in str(err.value)
 
@@ -1,23 +1,16 @@
 """Unit tests for workflow state helpers and decision application."""
 
 from datetime import UTC, datetime
-from pathlib import Path
-import sys
 from types import SimpleNamespace
 
-import pytest
+from sqlalchemy import select
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:  # pragma: no cover
-    sys.path.insert(0, str(ROOT))
-
-import app as app_module  # noqa: E402
-from slack_workflow_engine import config  # noqa: E402
-from slack_workflow_engine.db import Base, get_engine, get_session_factory, session_scope  # noqa: E402
-from slack_workflow_engine.models import Request  # noqa: E402
-from slack_workflow_engine.workflows import WorkflowDefinition  # noqa: E402
-from slack_workflow_engine.workflows.models import ApproverConfig  # noqa: E402
-from slack_workflow_engine.workflows.state import (  # noqa: E402
+import app as app_module
+from slack_workflow_engine.db import session_scope
+from slack_workflow_engine.models import Request
+from slack_workflow_engine.workflows import WorkflowDefinition
+from slack_workflow_engine.workflows.models import ApproverConfig
+from slack_workflow_engine.workflows.state import (
     compute_level_runtime,
     derive_initial_status,
     extract_level_from_status,
@@ -26,29 +19,6 @@ from slack_workflow_engine.workflows.state import (  # noqa: E402
 )
 
 
-@pytest.fixture(autouse=True)
-def configure_environment(monkeypatch, tmp_path):
-    db_path = tmp_path / "state.db"
-    monkeypatch.setenv("SLACK_BOT_TOKEN", "token")
-    monkeypatch.setenv("SLACK_SIGNING_SECRET", "secret")
-    monkeypatch.setenv("APPROVER_USER_IDS", "U1,U2,UTIE")
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
-
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
-
-    engine = get_engine()
-    Base.metadata.create_all(engine)
-
-    yield
-
-    Base.metadata.drop_all(engine)
-    config.get_settings.cache_clear()
-    get_engine.cache_clear()
-    get_session_factory.cache_clear()
-
-
 def _definition(levels):
     return WorkflowDefinition(
         type="demo",
@@ -106,7 +76,35 @@ def test_compute_level_runtime_tie_breaker_wait_list():
     assert "Awaiting tie-breaker" in format_status_text(runtime)
 
 
-def test_apply_level_decision_advances_levels():
+def _pending_request(session, *, request_key):
+    request = Request(
+        type="demo",
+        created_by="CREATOR",
+        payload_json="{}",
+        status="PENDING_L1",
+        request_key=request_key,
+    )
+    session.add(request)
+    session.flush()
+    return request
+
+
+def _decide(session, request, definition, *, user_id, decision):
+    """Record a channel decision without a reason or attachment."""
+
+    return app_module._apply_level_decision(
+        session,
+        request=request,
+        definition=definition,
+        user_id=user_id,
+        decision=decision,
+        source="channel",
+        reason=None,
+        attachment_url=None,
+    )
+
+
+def test_apply_level_decision_advances_levels(db_session_factory):
     definition = _definition(
         [
             {"members": ["U1"], "quorum": 1},
@@ -114,40 +112,17 @@ def test_apply_level_decision_advances_levels():
         ]
     )
     with session_scope() as session:
-        request = Request(
-            type="demo",
-            created_by="CREATOR",
-            payload_json="{}",
-            status="PENDING_L1",
-            request_key="demo-advance",
-        )
-        session.add(request)
-        session.commit()
-        session.refresh(request)
-        request_id = request.id
-
-        result_l1 = app_module._apply_level_decision(
-            session,
-            request=request,
-            definition=definition,
-            user_id="U1",
-            decision="APPROVED",
-            source="channel",
-            reason=None,
-            attachment_url=None,
-        )
-        session.commit()
-        session.refresh(request)
+        request = _pending_request(session, request_key="demo-advance")
+
+        result_l1 = _decide(session, request, definition, user_id="U1", decision="APPROVED")
+        stored_status = session.scalar(select(Request.status).where(Request.id == request.id))
 
     assert result_l1.final_decision is None
     assert result_l1.approver_level == 2
-
-    with session_scope() as session:
-        refreshed = session.get(Request, request_id)
-        assert refreshed.status == "PENDING_L2"
+    assert stored_status == "PENDING_L2"
 
 
-def test_apply_level_decision_tie_breaker_resolution():
+def test_apply_level_decision_tie_breaker_resolution(db_session_factory):
     definition = _definition(
         [
             {"members": ["U1", "U2"], "tie_breaker": "UTIE"},
@@ -155,53 +130,12 @@ def test_apply_level_decision_tie_breaker_resolution():
     )
 
     with session_scope() as session:
-        request = Request(
-            type="demo",
-            created_by="CREATOR",
-            payload_json="{}",
-            status="PENDING_L1",
-            request_key="demo-tie",
-        )
-        session.add(request)
-        session.commit()
-        session.refresh(request)
-        request_id = request.id
-
-        app_module._apply_level_decision(
-            session,
-            request=request,
-            definition=definition,
-            user_id="U1",
-            decision="APPROVED",
-            source="channel",
-            reason=None,
-            attachment_url=None,
-        )
-        app_module._apply_level_decision(
-            session,
-            request=request,
-            definition=definition,
-            user_id="U2",
-            decision="REJECTED",
-            source="channel",
-            reason=None,
-            attachment_url=None,
-        )
-        result_tie = app_module._apply_level_decision(
-            session,
-            request=request,
-            definition=definition,
-            user_id="UTIE",
-            decision="APPROVED",
-            source="channel",
-            reason=None,
-            attachment_url=None,
-        )
-        session.commit()
-        session.refresh(request)
+        request = _pending_request(session, request_key="demo-tie")
 
-    assert result_tie.final_decision == "APPROVED"
+        _decide(session, request, definition, user_id="U1", decision="APPROVED")
+        _decide(session, request, definition, user_id="U2", decision="REJECTED")
+        result_tie = _decide(session, request, definition, user_id="UTIE", decision="APPROVED")
+        stored_status = session.scalar(select(Request.status).where(Request.id == request.id))
 
-    with session_scope() as session:
-        refreshed = session.get(Request, request_id)
-        assert refreshed.status == "APPROVED"
+    assert result_tie.final_decision == "APPROVED"
+    assert stored_status == "APPROVED"
@@ -0,0 +1,58 @@
+"""Tests for workflow request storage helpers."""
+
+import pytest
+
+from slack_workflow_engine.models import DuplicateRequestError, Request
+from slack_workflow_engine.workflows import storage
+from slack_workflow_engine.workflows.storage import save_message_reference, save_request
+
+
+@pytest.fixture(params=["on_conflict", "select_then_insert"])
+def insert_strategy(request, monkeypatch, shared_engine):
+    if request.param == "select_then_insert":
+        # Stand in for a backend with neither ON CONFLICT nor INSERT ... RETURNING.
+        monkeypatch.setattr(storage, "_ON_CONFLICT_INSERTS", {})
+        monkeypatch.setattr(shared_engine.dialect, "insert_returning", False)
+    return request.param
+
+
+def test_save_request_returns_detached_entity(db_session_factory, insert_strategy):
+    request = save_request(
+        workflow_type="refund",
+        created_by="U1",
+        payload_json="{}",
+        request_key=f"key-{insert_strategy}",
+    )
+
+    assert request.id is not None
+    assert request.status == "PENDING"
+    assert request.version == 1
+    assert request.created_at is not None
+
+    with db_session_factory() as session:
+        assert session.get(Request, request.id).request_key == f"key-{insert_strategy}"
+
+
+def test_save_request_rejects_duplicate_key(db_session_factory, insert_strategy):
+    save_request(workflow_type="refund", created_by="U1", payload_json="{}", request_key="dup")
+
+    with pytest.raises(DuplicateRequestError):
+        save_request(workflow_type="refund", created_by="U1", payload_json="{}", request_key="dup")
+
+
+@pytest.mark.parametrize("insert_returning", [True, False], ids=["returning", "flush"])
+def test_save_message_reference_returns_detached_entity(
+    db_session_factory, shared_engine, monkeypatch, insert_returning
+):
+    request = save_request(workflow_type="refund", created_by="U1", payload_json="{}", request_key="key-message")
+    monkeypatch.setattr(shared_engine.dialect, "insert_returning", insert_returning)
+
+    message = save_message_reference(request_id=request.id, channel_id="C1", ts="1700000000.1")
+
+    assert message.id is not None
+    assert (message.request_id, message.channel_id, message.ts, message.thread_ts) == (
+        request.id,
+        "C1",
+        "1700000000.1",
+        None,
+    )
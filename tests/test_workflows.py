@@ -1,15 +1,10 @@
 """Tests for workflow definition loading."""
 
 import json
-from pathlib import Path
-import sys
+import os
 
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
 from slack_workflow_engine.workflows import (
     WorkflowDefinition,
     load_workflow_definition,
@@ -55,6 +50,28 @@ def test_load_workflow_definition_parses_valid_json(tmp_path):
     assert definition.notify_channel == "C12345678"
 
 
+def test_load_workflow_definition_rereads_modified_file(tmp_path):
+    content = {
+        "type": "refund",
+        "title": "Refund Request",
+        "fields": [{"name": "order_id", "label": "Order ID", "type": "text"}],
+        "approvers": {"strategy": "sequential", "levels": [["U1"]]},
+        "notify_channel": "C12345678",
+    }
+    file_path = tmp_path / "refund.json"
+    file_path.write_text(json.dumps(content), encoding="utf-8")
+
+    first = load_workflow_definition(file_path)
+    assert load_workflow_definition(file_path) is first
+
+    content["title"] = "Updated Refund"
+    file_path.write_text(json.dumps(content), encoding="utf-8")
+    mtime_ns = file_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(file_path, ns=(mtime_ns, mtime_ns))
+
+    assert load_workflow_definition(file_path).title == "Updated Refund"
+
+
 def test_invalid_field_type_raises_error(tmp_path):
     content = {
         "type": "invalid",